@@ -6,14 +6,14 @@ import os
 from typing import Dict, List, Optional
 
 import openai
-from dotenv import load_dotenv
 from openai import AzureOpenAI
 
 from src.aoai.tokenizer import AzureOpenAITokenizer
+from src.utils import load_env_once
 from utils.ml_logging import get_logger
 
 # Load environment variables from .env file
-load_dotenv()
+load_env_once()
 
 # Set up logger
 logger = get_logger()
@@ -6,16 +6,14 @@ from typing import Dict, List, Optional, Union
 
 import tiktoken
 
-# Load environment variables from .env file
-from dotenv import load_dotenv
-
 from src.aoai.settings import encoding_name_for_model
+from src.utils import load_env_once
 from utils.ml_logging import get_logger
 
 # Set up logger
 logger = get_logger()
 
-load_dotenv()
+load_env_once()
 
 
 class AzureOpenAITokenizer:
@@ -1,4 +1,5 @@
-from typing import List, Literal, Optional, Union
+from functools import lru_cache
+from typing import List, Literal, Optional, Sequence, Union
 
 from langchain.docstore.document import Document
 from langchain.text_splitter import (
@@ -9,12 +10,121 @@ from langchain.text_splitter import (
 
 from src.aoai.settings import encoding_name_for_model
 from src.chunkers.base import DocumentSplitter
-from src.chunkers.utils import count_length_per_chunk
+from src.chunkers.utils import count_length_per_chunk, dedupe_chunks
 from utils.ml_logging import get_logger
 
 # Initialize logging
 logger = get_logger()
 
+# Splitter types understood by get_splitter
+_SPLITTER_TYPES = (
+    "by_character_recursive",
+    "by_character_brute_force",
+    "by_title_brute_force",
+)
+
+# Splitter names accepted by earlier releases, mapped to their current equivalent
+_LEGACY_SPLITTER_TYPES = {
+    "recursive": "by_character_recursive",
+    "tiktoken": "by_character_recursive",
+    "character": "by_character_brute_force",
+}
+
+
+def _build_splitter(
+    splitter_type: str,
+    use_encoder: bool,
+    chunk_size: int,
+    chunk_overlap: int,
+    recursive_separators: Optional[Sequence[str]],
+    char_separator: Optional[str],
+    keep_separator: bool,
+    is_separator_regex: bool,
+    model_name: Optional[str],
+    **kwargs,
+) -> Union[RecursiveCharacterTextSplitter, CharacterTextSplitter]:
+    """
+    Creates a text splitter. See CharacterDocumentSplitter.get_splitter for the parameters.
+    """
+    if recursive_separators is not None:
+        recursive_separators = list(recursive_separators)
+
+    try:
+        splitter_type = _LEGACY_SPLITTER_TYPES.get(splitter_type, splitter_type)
+        if splitter_type not in _SPLITTER_TYPES:
+            logger.warning(
+                f"Unknown splitter type {splitter_type}, using by_character_recursive."
+            )
+            splitter_type = "by_character_recursive"
+        logger.info(f"Creating a splitter of type: {splitter_type}")
+        if splitter_type == "by_character_recursive":
+            if use_encoder:
+                if model_name is None:
+                    raise ValueError(
+                        "Model name must be provided. if use_encoder is True."
+                    )
+                encodername = encoding_name_for_model(model_name)
+                logger.info(f"Using tiktoken encoder: {encodername}")
+                return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+                    encoding_name=encodername,
+                    chunk_size=chunk_size,
+                    chunk_overlap=chunk_overlap,
+                    separators=recursive_separators,
+                    keep_separator=keep_separator,
+                    is_separator_regex=is_separator_regex,
+                    **kwargs,
+                )
+            else:
+                return RecursiveCharacterTextSplitter(
+                    chunk_size=chunk_size,
+                    chunk_overlap=chunk_overlap,
+                    separators=recursive_separators,
+                    keep_separator=keep_separator,
+                    is_separator_regex=is_separator_regex,
+                    **kwargs,
+                )
+        elif splitter_type == "by_title_brute_force":
+            encodername = encoding_name_for_model(model_name)
+            logger.info(f"Using tiktoken encoder: {encodername}")
+            return MarkdownTextSplitter.from_tiktoken_encoder(
+                encoding_name=encodername,
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+            )
+
+        elif splitter_type == "by_character_brute_force":
+            if use_encoder:
+                if model_name is None:
+                    raise ValueError(
+                        "Model name must be provided. if use_encoder is True."
+                    )
+                encodername = encoding_name_for_model(model_name)
+                logger.info(f"Using tiktoken encoder: {encodername}")
+                return CharacterTextSplitter.from_tiktoken_encoder(
+                    encoding_name=encodername,
+                    chunk_size=chunk_size,
+                    chunk_overlap=chunk_overlap,
+                    separators=recursive_separators,
+                    keep_separator=keep_separator,
+                    is_separator_regex=is_separator_regex,
+                    **kwargs,
+                )
+            return CharacterTextSplitter(
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                separator=char_separator,
+                is_separator_regex=is_separator_regex,
+                **kwargs,
+            )
+    except Exception as e:
+        logger.error(f"Failed to get splitter: {e}")
+        raise
+
+
+# Splitters hold no per-call state, and building one (notably loading a tiktoken encoder) is
+# comparatively expensive, so splitters without extra kwargs are reused across calls
+_get_cached_splitter = lru_cache(maxsize=32)(_build_splitter)
+
 
 class CharacterDocumentSplitter(DocumentSplitter):
     """
@@ -42,15 +152,16 @@ class CharacterDocumentSplitter(DocumentSplitter):
         """
         Returns an instance of a text splitter based on the provided parameters.
 
-        :param splitter_type: The type of splitter to use. Can be "recursive" or "character". If not found, the character
-        splitter will be used. Defaults to "recursive".
+        :param splitter_type: The type of splitter to use. Can be "by_character_recursive", "by_character_brute_force"
+        or "by_title_brute_force". Unknown types use the token-based recursive splitter. Defaults to "by_character_recursive".
         :param use_encoder: Boolean flag to choose whether to use an encoder for the splitter. Defaults to True.
-        :param chunk_size: The number of characters in each text chunk. Defaults to 512.
-        :param chunk_overlap: The number of characters to overlap between chunks. Defaults to 128.
+        :param chunk_size: The size of each text chunk, counted in tokens when use_encoder is True
+        and in characters otherwise. Defaults to 512.
+        :param chunk_overlap: The overlap between chunks, in the same unit as chunk_size. Defaults to 128.
         :param recursive_separators: List of strings or regex patterns to use as separators for splitting with
-          RecursiveCharacterTextSplitter. Only applicable if splitter_type is "recursive".
+          RecursiveCharacterTextSplitter. Only applicable if splitter_type is "by_character_recursive".
         :param char_separator: String or regex pattern to use as a separator for splitting with CharacterTextSplitter. Only
-        applicable if splitter_type is "character".
+        applicable if splitter_type is "by_character_brute_force".
         :param keep_separator: Whether to keep the separators in the resulting chunks. Defaults to True.
         :param is_separator_regex: Treat the separators as regex patterns. Defaults to False.
         :param model_name: The name of the model to use for encoding, if use_encoder is True. Defaults to "gpt-4".
@@ -58,71 +169,33 @@ class CharacterDocumentSplitter(DocumentSplitter):
         :return: An instance of either RecursiveCharacterTextSplitter or CharacterTextSplitter.
         :raises ValueError: If use_encoder is True but model_name is not provided.
         :raises Exception: If there's an error while creating the splitter.
-        """
-        try:
-            logger.info(f"Creating a splitter of type: {splitter_type}")
-            if splitter_type == "by_character_recursive":
-                if use_encoder:
-                    if model_name is None:
-                        raise ValueError(
-                            "Model name must be provided. if use_encoder is True."
-                        )
-                    encodername = encoding_name_for_model(model_name)
-                    logger.info(f"Using tiktoken encoder: {encodername}")
-                    return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
-                        encoding_name=encodername,
-                        chunk_size=chunk_size,
-                        chunk_overlap=chunk_overlap,
-                        separators=recursive_separators,
-                        keep_separator=keep_separator,
-                        is_separator_regex=is_separator_regex,
-                        **kwargs,
-                    )
-                else:
-                    return RecursiveCharacterTextSplitter(
-                        chunk_size=chunk_size,
-                        chunk_overlap=chunk_overlap,
-                        separators=recursive_separators,
-                        keep_separator=keep_separator,
-                        is_separator_regex=is_separator_regex,
-                        **kwargs,
-                    )
-            elif splitter_type == "by_title_brute_force":
-                encodername = encoding_name_for_model(model_name)
-                logger.info(f"Using tiktoken encoder: {encodername}")
-                return MarkdownTextSplitter.from_tiktoken_encoder(
-                    encoding_name=encodername,
-                    chunk_size=chunk_size,
-                    chunk_overlap=chunk_overlap,
-                )
 
-            elif splitter_type == "by_character_brute_force":
-                if use_encoder:
-                    if model_name is None:
-                        raise ValueError(
-                            "Model name must be provided. if use_encoder is True."
-                        )
-                    encodername = encoding_name_for_model(model_name)
-                    logger.info(f"Using tiktoken encoder: {encodername}")
-                    return CharacterTextSplitter.from_tiktoken_encoder(
-                        encoding_name=encodername,
-                        chunk_size=chunk_size,
-                        chunk_overlap=chunk_overlap,
-                        separators=recursive_separators,
-                        keep_separator=keep_separator,
-                        is_separator_regex=is_separator_regex,
-                        **kwargs,
-                    )
-                return CharacterTextSplitter(
-                    chunk_size=chunk_size,
-                    chunk_overlap=chunk_overlap,
-                    separator=char_separator,
-                    is_separator_regex=is_separator_regex,
-                    **kwargs,
-                )
-        except Exception as e:
-            logger.error(f"Failed to get splitter: {e}")
-            raise
+        Splitters created without extra kwargs are cached and shared between calls.
+        """
+        if not kwargs:
+            return _get_cached_splitter(
+                splitter_type,
+                use_encoder,
+                chunk_size,
+                chunk_overlap,
+                tuple(recursive_separators) if recursive_separators else None,
+                char_separator,
+                keep_separator,
+                is_separator_regex,
+                model_name,
+            )
+        return _build_splitter(
+            splitter_type,
+            use_encoder,
+            chunk_size,
+            chunk_overlap,
+            recursive_separators,
+            char_separator,
+            keep_separator,
+            is_separator_regex,
+            model_name,
+            **kwargs,
+        )
 
     def split_documents_in_chunks_from_documents(
         self,
@@ -139,13 +212,16 @@ class CharacterDocumentSplitter(DocumentSplitter):
         is_separator_regex: bool = False,
         model_name: Optional[str] = "gpt-4",
         verbose: bool = False,
+        dedupe: bool = False,
         **kwargs,
     ) -> List[Document]:
         """
         Splits documents into smaller chunks.
 
         :param documents: List of Document objects to split.
-        :param splitter_type: Type of splitter ("recursive", "tiktoken", "spacy", "character"). Defaults to "recursive".
+        :param splitter_type: Type of splitter ("by_character_recursive", "by_character_brute_force",
+          "by_title_brute_force"). Legacy names "recursive", "tiktoken" and "character" are still accepted.
+          Defaults to "by_character_recursive".
         :param use_encoder: If True, uses an encoder for the splitter. Defaults to True.
         :param chunk_size: Number of characters in each chunk. Defaults to 512.
         :param chunk_overlap: Number of characters to overlap between chunks. Defaults to 128.
@@ -155,6 +231,7 @@ class CharacterDocumentSplitter(DocumentSplitter):
         :param is_separator_regex: If True, treats the separators as regex. Defaults to False.
         :param model_name: Name of the model for encoding, if use_encoder is True. Defaults to "gpt-4".
         :param verbose: If True, logs detailed information about the chunks. Defaults to False.
+        :param dedupe: If True, drops chunks whose text repeats an earlier chunk before they are embedded. Defaults to False.
         :param kwargs: Additional arguments for the splitter class.
         :return: List of Document objects representing the chunks.
         :raises Exception: If there's an error while creating the splitter or splitting the text.
@@ -177,6 +254,10 @@ class CharacterDocumentSplitter(DocumentSplitter):
             chunks = text_splitter.split_documents(documents)
             logger.info(f"Number of chunks obtained: {len(chunks)}")
 
+            if dedupe:
+                chunks = dedupe_chunks(chunks)
+                logger.info(f"Number of chunks after deduplication: {len(chunks)}")
+
             if verbose:
                 count_length_per_chunk(chunks, model_name)
 
@@ -1,10 +1,13 @@
 import fnmatch
+import importlib.util
 import re
 
 from langchain.document_loaders import (
     CSVLoader,
     Docx2txtLoader,
     JSONLoader,
+    PyMuPDFLoader,
+    PyPDFium2Loader,
     PyPDFLoader,
     TextLoader,
     UnstructuredExcelLoader,
@@ -13,19 +16,30 @@ from langchain.document_loaders import (
     UnstructuredPowerPointLoader,
 )
 
+# PyMuPDF and pypdfium2 are optional; when installed, PDF text is extracted by their
+# native parsers instead of pypdf's pure-Python one
+if importlib.util.find_spec("fitz") is not None:
+    PDF_LOADER = PyMuPDFLoader
+elif importlib.util.find_spec("pypdfium2") is not None:
+    PDF_LOADER = PyPDFium2Loader
+else:
+    PDF_LOADER = PyPDFLoader
+
+FILE_EXTENSION_MAPPINGS_LANGCHAIN = {
+    ".txt": TextLoader,
+    ".pdf": PDF_LOADER,
+    ".csv": CSVLoader,
+    ".docx": Docx2txtLoader,
+    ".xlss": UnstructuredExcelLoader,
+    ".xlsx": UnstructuredExcelLoader,
+    ".html": UnstructuredHTMLLoader,
+    ".pptx": UnstructuredPowerPointLoader,
+    ".ppt": UnstructuredPowerPointLoader,
+    ".md": UnstructuredMarkdownLoader,
+    ".json": JSONLoader,
+}
+
 FILE_TYPE_MAPPINGS_LANGCHAIN = {
-    re.compile(fnmatch.translate(pattern)): loader_class
-    for pattern, loader_class in {
-        "*.txt": TextLoader,
-        "*.pdf": PyPDFLoader,
-        "*.csv": CSVLoader,
-        "*.docx": Docx2txtLoader,
-        "*.xlss": UnstructuredExcelLoader,
-        "*.xlsx": UnstructuredExcelLoader,
-        "*.html": UnstructuredHTMLLoader,
-        "*.pptx": UnstructuredPowerPointLoader,
-        "*.ppt": UnstructuredPowerPointLoader,
-        "*.md": UnstructuredMarkdownLoader,
-        "*.json": JSONLoader,
-    }.items()
+    re.compile(fnmatch.translate(f"*{extension}")): loader_class
+    for extension, loader_class in FILE_EXTENSION_MAPPINGS_LANGCHAIN.items()
 }
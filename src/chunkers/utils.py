@@ -1,3 +1,4 @@
+from hashlib import blake2b
 from typing import List
 
 import tiktoken
@@ -25,3 +26,22 @@ def count_length_per_chunk(
         print(
             f"Chunk Number: {idx_chunk+1}, Character Count: {chunk_length}, Token Count: {token_count}"
         )
+
+
+def dedupe_chunks(chunks: List[Document]) -> List[Document]:
+    """
+    Removes chunks whose text repeats an earlier chunk, keeping the first occurrence.
+
+    Texts are compared after stripping surrounding whitespace and lowercasing, so repeated
+    headers and footers collapse to a single chunk. Order is preserved.
+
+    :param chunks: List of Document chunks to deduplicate.
+    :return: The chunks with duplicates removed.
+    """
+    unique = {}
+    for chunk in chunks:
+        key = blake2b(
+            chunk.page_content.strip().lower().encode("utf-8"), digest_size=16
+        ).digest()
+        unique.setdefault(key, chunk)
+    return list(unique.values())
@@ -3,14 +3,14 @@ import os
 from typing import List
 
 import uvicorn
-from dotenv import load_dotenv
 from fastapi import FastAPI
 from langchain.text_splitter import MarkdownTextSplitter
 from pydantic import BaseModel
 
 from src.enrichers.ocr_document_intelligence import AzureDocumentIntelligenceManager
+from src.utils import load_env_once
 
-load_dotenv()
+load_env_once()
 
 logger = logging.getLogger("uvicorn")
 logger.setLevel(logging.INFO)
@@ -7,16 +7,39 @@ from azure.ai.documentintelligence import DocumentIntelligenceClient, models
 # from azure.ai.formrecognizer import DocumentAnalysisClient
 from azure.ai.documentintelligence.models import AnalyzeDocumentRequest
 from azure.core.credentials import AzureKeyCredential
+from azure.core.exceptions import HttpResponseError
 from azure.core.polling import LROPoller
-from dotenv import load_dotenv
 
 from src.extractors.blob_data_extractors import AzureBlobDataExtractor
+from src.utils import load_env_once
 from utils.ml_logging import get_logger
 
 # Initialize logging
 logger = get_logger()
 
 
+@lru_cache(maxsize=8)
+def _get_document_intelligence_client(
+    azure_endpoint: str, azure_key: str
+) -> DocumentIntelligenceClient:
+    """
+    Returns the process-wide DocumentIntelligenceClient for an endpoint and key.
+
+    Managers created for the same resource share one client, so its credential and HTTP
+    pipeline are built once instead of on every instantiation.
+
+    :param azure_endpoint: Endpoint URL for Azure's Document Analysis Client.
+    :param azure_key: API key for Azure's Document Analysis Client.
+    :return: The cached DocumentIntelligenceClient.
+    """
+    return DocumentIntelligenceClient(
+        endpoint=azure_endpoint,
+        credential=AzureKeyCredential(azure_key),
+        headers={"x-ms-useragent": "langchain-parser/1.0.0"},
+        polling_interval=30,
+    )
+
+
 class AzureDocumentIntelligenceManager:
     """
     A class to interact with Azure's Document Analysis Client.
@@ -48,21 +71,17 @@ class AzureDocumentIntelligenceManager:
 
         self.blob_manager = AzureBlobDataExtractor(container_name=container_name)
 
-        self.document_analysis_client = DocumentIntelligenceClient(
-            endpoint=self.azure_endpoint,
-            credential=AzureKeyCredential(self.azure_key),
-            headers={"x-ms-useragent": "langchain-parser/1.0.0"},
-            polling_interval=30,
+        self.document_analysis_client = _get_document_intelligence_client(
+            self.azure_endpoint, self.azure_key
         )
 
-    @lru_cache(maxsize=30)
     def load_environment_variables_from_env_file(self):
         """
         Loads required environment variables for the application from a .env file.
 
         This method should be called explicitly if environment variables are to be loaded from a .env file.
         """
-        load_dotenv()
+        load_env_once()
 
         self.azure_endpoint = os.getenv("AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT")
         self.azure_key = os.getenv("AZURE_DOCUMENT_INTELLIGENCE_KEY")
@@ -91,6 +110,7 @@ class AzureDocumentIntelligenceManager:
         query_fields: Optional[List[str]] = None,
         output_format: Optional[Union[str, models.ContentFormat]] = None,
         content_type: str = "application/json",
+        use_sas_url: bool = False,
         **kwargs: Any,
     ) -> LROPoller:
         """
@@ -128,6 +148,10 @@ class AzureDocumentIntelligenceManager:
         :param query_fields: List of additional fields to extract.
         :param output_content_format: Format of the analyze result top-level content.
         :param content_type: Body Parameter content-type. Content type parameter for JSON body.
+        :param use_sas_url: For blob URLs, let the service read the blob through a short-lived SAS URL
+            instead of downloading and uploading its content. The storage account must be reachable
+            by Document Intelligence (no firewall or private endpoint); if the URL analysis fails,
+            the content is uploaded instead. Defaults to False.
         :param kwargs: Additional keyword arguments to pass to the analysis method.
         :return: An instance of LROPoller that returns AnalyzeResult.
         """
@@ -144,11 +168,8 @@ class AzureDocumentIntelligenceManager:
                 raise ValueError("HTTP URLs are not supported. Please use HTTPS.")
             # If it's an HTTPS URL but contains "blob.core.windows.net", process it as a blob
             elif "blob.core.windows.net" in document_input:
-                logger.info("Blob URL detected. Extracting content.")
-                content_bytes = self.blob_manager.extract_content(document_input)
-                poller = self.document_analysis_client.begin_analyze_document(
+                analyze_kwargs = dict(
                     model_id=model_type,
-                    analyze_request=AnalyzeDocumentRequest(base64_source=content_bytes),
                     pages=pages,
                     locale=locale,
                     string_index_type=string_index_type,
@@ -158,6 +179,29 @@ class AzureDocumentIntelligenceManager:
                     content_type=content_type,
                     **kwargs,
                 )
+                sas_url = (
+                    self.blob_manager.generate_blob_sas_url(document_input)
+                    if use_sas_url
+                    else None
+                )
+                if sas_url is not None:
+                    logger.info("Blob URL detected. Analyzing it through a SAS URL.")
+                    try:
+                        return self.document_analysis_client.begin_analyze_document(
+                            analyze_request=AnalyzeDocumentRequest(url_source=sas_url),
+                            **analyze_kwargs,
+                        ).result()
+                    except HttpResponseError as e:
+                        # Typically a storage account the service cannot reach
+                        logger.warning(
+                            f"Analyzing through a SAS URL failed, uploading the content instead: {e}"
+                        )
+                logger.info("Blob URL detected. Extracting content.")
+                content_bytes = self.blob_manager.extract_content(document_input)
+                poller = self.document_analysis_client.begin_analyze_document(
+                    analyze_request=AnalyzeDocumentRequest(base64_source=content_bytes),
+                    **analyze_kwargs,
+                )
             else:
                 poller = self.document_analysis_client.begin_analyze_document(
                     model_id=model_type,
@@ -3,11 +3,11 @@ import os
 from typing import Dict, List, Optional, Union
 
 import requests
-from dotenv import load_dotenv
 from IPython.display import Image, display
 from requests.exceptions import RequestException
 
 from src.extractors.blob_data_extractor import AzureBlobDataExtractor
+from src.utils import load_env_once
 from utils.ml_logging import get_logger
 
 # Initialize logging
@@ -57,7 +57,7 @@ class GPT4VisionManager:
 
         This method should be called explicitly if environment variables are to be loaded from a .env file.
         """
-        load_dotenv()
+        load_env_once()
 
         self.openai_api_base = os.getenv("AZURE_OPENAI_ENDPOINT_VISION")
         self.deployment_name = os.getenv("AZURE_OPENAI_API_DEPLOYMENT_NAME_VISION")
@@ -1,19 +1,22 @@
+import asyncio
 import os
 import tempfile
 import time
 import urllib.parse
 import wave
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 import azure.cognitiveservices.speech as speechsdk
 import numpy as np
 from azure.cognitiveservices.speech import AudioConfig, SpeechConfig
-from azure.storage.blob import BlobServiceClient
-from dotenv import load_dotenv
+from azure.storage.blob.aio import BlobServiceClient as AsyncBlobServiceClient
 
+from src.extractors.blob_data_extractors import get_blob_service_client
+from src.utils import load_env_once
 from utils.ml_logging import get_logger
 
-load_dotenv()
+load_env_once()
 
 logger = get_logger()
 
@@ -46,6 +49,32 @@ def conversation_transcriber_recognition_canceled_cb(evt: speechsdk.SessionEvent
     logger.info(f"Canceled event: {evt}")
 
 
+def speech_recognizer_recognizing_cb(evt: speechsdk.SpeechRecognitionEventArgs):
+    logger.info(f"RECOGNIZING: {evt}")
+
+
+def speech_recognizer_recognized_cb(evt: speechsdk.SpeechRecognitionEventArgs):
+    logger.info(f"RECOGNIZED: {evt.result.text}, Language: {evt.result.language}")
+
+
+def speech_recognizer_session_started_cb(evt: speechsdk.SessionEventArgs):
+    logger.info(f"SESSION STARTED: {evt}")
+
+
+def speech_recognizer_session_stopped_cb(evt: speechsdk.SessionEventArgs):
+    logger.info(f"SESSION STOPPED {evt}")
+
+
+def speech_recognizer_canceled_cb(evt: speechsdk.SpeechRecognitionCanceledEventArgs):
+    logger.info(f"CANCELED {evt}")
+
+
+def speech_recognizer_recognition_canceled_cb(
+    evt: speechsdk.SpeechRecognitionCanceledEventArgs,
+):
+    logger.info(f"RECOGNITION CANCELED: {evt.result.reason}")
+
+
 class SpeechCoreTranslator:
     """
     A class that serves as the core for handling Azure AI Services Speech SDK functionality.
@@ -85,20 +114,139 @@ class SpeechCoreTranslator:
         :return: A BlobClient object for the specified blob URL, or None if the connection string is not set.
         :rtype: Optional[BlobClient]
         """
-        parsed_url = urllib.parse.urlparse(blob_url)
-        blob_name = os.path.basename(parsed_url.path)
-        container_name = os.path.basename(os.path.dirname(parsed_url.path))
+        container_name, blob_name = self._parse_blob_url(blob_url)
         if not self.connection_string:
             logger.error("Azure storage connection string is not set.")
             return None
 
-        blob_service_client = BlobServiceClient.from_connection_string(
-            self.connection_string
-        )
+        blob_service_client = get_blob_service_client(self.connection_string)
         return blob_service_client.get_blob_client(
             container=container_name, blob=blob_name
         )
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_blob_url(blob_url: str) -> Tuple[str, str]:
+        """
+        Splits a blob URL into its container name and blob name.
+        Blob names may contain virtual directories, e.g. 'audio/2024/call.wav'.
+
+        :param blob_url: The URL of the blob.
+        :return: A tuple of (container_name, blob_name).
+        :raises ValueError: If the URL does not include both a container and a blob name.
+        """
+        parsed_url = urllib.parse.urlparse(blob_url)
+        parts = parsed_url.path.lstrip("/").split("/", 1)
+        if len(parts) != 2 or not parts[0] or not parts[1]:
+            raise ValueError(
+                f"Invalid blob URL {blob_url}: expected a container and a blob name in the path."
+            )
+        container_name, blob_name = parts
+        return container_name, blob_name
+
+    async def _download_blob_to_temp_file_async(
+        self, blob_service_client: AsyncBlobServiceClient, blob_url: str
+    ) -> str:
+        """
+        Downloads a blob into a named temporary file using the async BlobServiceClient.
+
+        :param blob_service_client: The async BlobServiceClient of the current batch.
+        :param blob_url: URL of the blob containing the audio file.
+        :return: Path of the temporary file.
+        """
+        container_name, blob_name = self._parse_blob_url(blob_url)
+        blob_client = blob_service_client.get_blob_client(
+            container=container_name, blob=blob_name
+        )
+        temp_file = tempfile.NamedTemporaryFile(delete=False)
+        try:
+            with temp_file:
+                download_stream = await blob_client.download_blob()
+                await download_stream.readinto(temp_file)
+        except BaseException:
+            # Don't leave a partial download behind, including when the task is cancelled
+            os.remove(temp_file.name)
+            raise
+        return temp_file.name
+
+    async def transcribe_many_async(
+        self,
+        sources: List[str],
+        max_concurrency: int = 4,
+        **kwargs,
+    ) -> List[Optional[str]]:
+        """
+        Transcribes several audio sources concurrently, overlapping blob downloads with Speech sessions.
+
+        Each source can be a local file path or a blob URL. Blobs are downloaded with the async
+        BlobServiceClient while the synchronous Speech SDK calls run in worker threads, so the next
+        file is fetched while the current one is being transcribed.
+
+        :param sources: List of local file paths and/or blob URLs.
+        :param max_concurrency: Maximum number of sources downloaded or transcribed at the same time.
+        :param kwargs: Additional keyword arguments passed to `transcribe_speech_from_file_continuous`
+                       (e.g. language, auto_detect_source_language, diarization).
+        :return: List of transcribed texts, in the same order as `sources`; None for sources that failed.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        blob_service_client: Optional[AsyncBlobServiceClient] = None
+
+        async def _transcribe_source(source: str) -> Optional[str]:
+            async with semaphore:
+                if "blob.core.windows.net" not in source:
+                    return await asyncio.to_thread(
+                        self.transcribe_speech_from_file_continuous,
+                        file_path=source,
+                        **kwargs,
+                    )
+
+                if blob_service_client is None:
+                    logger.error("Azure storage connection string is not set.")
+                    return None
+                temp_file_path = await self._download_blob_to_temp_file_async(
+                    blob_service_client, source
+                )
+                try:
+                    return await asyncio.to_thread(
+                        self.transcribe_speech_from_file_continuous,
+                        file_path=temp_file_path,
+                        **kwargs,
+                    )
+                finally:
+                    try:
+                        os.remove(temp_file_path)
+                        logger.info(f"Deleted temporary file: {temp_file_path}")
+                    except OSError as e:
+                        logger.warning(f"Error deleting temporary file: {e}")
+
+        # The async client is bound to the running event loop, so it is opened and closed
+        # within each call instead of being kept on the instance
+        if self.connection_string and any(
+            "blob.core.windows.net" in source for source in sources
+        ):
+            blob_service_client = AsyncBlobServiceClient.from_connection_string(
+                self.connection_string
+            )
+        try:
+            # gather returns only once every source has finished, so the client is not
+            # closed under a download that is still running
+            results = await asyncio.gather(
+                *(_transcribe_source(source) for source in sources),
+                return_exceptions=True,
+            )
+        finally:
+            if blob_service_client is not None:
+                await blob_service_client.close()
+
+        transcripts: List[Optional[str]] = []
+        for source, result in zip(sources, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to transcribe {source}: {result}")
+                transcripts.append(None)
+            else:
+                transcripts.append(result)
+        return transcripts
+
     def transcribe_speech_from_file_continuous(
         self,
         file_path: Optional[str] = None,
@@ -178,7 +326,7 @@ class SpeechCoreTranslator:
         if not os.path.isabs(file_path):
             file_path = os.path.abspath(file_path)
         audio_config = speechsdk.AudioConfig(filename=file_path)
-        return self._transcribe_continous(
+        return self._run_recognition(
             audio_config,
             language,
             source_language_config,
@@ -207,13 +355,13 @@ class SpeechCoreTranslator:
         if blob_client is None:
             return None
 
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            download_stream = blob_client.download_blob()
-            temp_file.write(download_stream.readall())
-            audio_config = speechsdk.AudioConfig(filename=temp_file.name)
-
+        temp_file = tempfile.NamedTemporaryFile(delete=False)
         try:
-            result = self._transcribe_continous(
+            with temp_file:
+                # Stream the audio to disk with parallel range requests instead of buffering it
+                blob_client.download_blob(max_concurrency=8).readinto(temp_file)
+                audio_config = speechsdk.AudioConfig(filename=temp_file.name)
+            result = self._run_recognition(
                 audio_config,
                 language,
                 source_language_config,
@@ -229,20 +377,23 @@ class SpeechCoreTranslator:
 
         return result
 
-    def _transcribe_continous(
+    def _run_recognition(
         self,
         audio_config,
         language,
         source_language_config,
         auto_detect_source_language_config,
+        diarization: bool = False,
     ) -> str:
         """
         Core function to handle speech recognition and transcription.
+        Subclasses override this to run a different recognizer on the same audio configuration.
 
         :param audio_config: Audio configuration object.
         :param language: Language code for speech recognition.
         :param source_language_config: Configuration for source language.
         :param auto_detect_source_language_config: Configuration for auto detecting source language.
+        :param diarization: Unused by the base speech recognizer, which does not identify speakers.
         :return: Transcribed text.
         """
         speech_recognizer = speechsdk.SpeechRecognizer(
@@ -280,16 +431,26 @@ class SpeechCoreTranslator:
         language: str = None,
         source_language_config: speechsdk.SourceLanguageConfig = None,
         auto_detect_source_language_config: speechsdk.AutoDetectSourceLanguageConfig = None,
+        max_buffer_seconds: float = 30.0,
+        stall_timeout_seconds: float = 30.0,
     ):
         """
         Recognizes speech from a custom audio source using a push audio stream.
         Converts stereo audio to mono in real-time before pushing it to the stream.
 
+        The amount of audio pushed but not yet processed by the service is bounded by
+        `max_buffer_seconds`. When the bound is reached, pushing pauses until recognized events
+        (including silence and unrecognized audio) move the processed position forward; if the
+        service stays stalled for `stall_timeout_seconds`, a warning is logged and the rest of the
+        file is pushed at real-time pace, so no audio is ever dropped.
+
         Args:
             audio_file (str): The name of the audio file to transcribe.
             language (str, optional): The language to use for speech recognition. Defaults to None.
             source_language_config (SourceLanguageConfig, optional): The source language configuration. Defaults to None.
             auto_detect_source_language_config (AutoDetectSourceLanguageConfig, optional): The auto detect source language configuration. Defaults to None.
+            max_buffer_seconds (float, optional): Maximum seconds of audio in flight. Defaults to 30.0.
+            stall_timeout_seconds (float, optional): Seconds to wait for the buffer to drain before resuming anyway. Defaults to 30.0.
         """
         try:
             speech_config = speechsdk.SpeechConfig(
@@ -308,44 +469,92 @@ class SpeechCoreTranslator:
             done = False
             wav_fh = wave.open(audio_file, "rb")
             final_text = ""
+            # Mono 16-bit PCM is pushed, so one second of audio is frame_rate * 2 bytes.
+            bytes_per_second = wav_fh.getframerate() * 2
+            max_in_flight_bytes = int(max_buffer_seconds * bytes_per_second)
+            pushed_bytes = 0
+            processed_bytes = 0
+            flow_control = True
 
             def update_final_text(evt):
-                nonlocal final_text
-                final_text += " " + evt.result.text
+                nonlocal final_text, processed_bytes
+                if evt.result.text:
+                    final_text += " " + evt.result.text
+                # offset and duration are in 100-nanosecond ticks from the start of the stream;
+                # their sum is how far the service has processed, silence included
+                processed_ticks = evt.result.offset + evt.result.duration
+                processed_bytes = max(
+                    processed_bytes, int(processed_ticks / 1e7 * bytes_per_second)
+                )
 
             def stop_cb(evt):
                 logger.info(f"CLOSING on {evt}")
                 nonlocal done
                 done = True
 
-            speech_recognizer.recognizing.connect(
-                lambda evt: logger.info(f"RECOGNIZING: {evt}")
-            )
+            speech_recognizer.recognizing.connect(speech_recognizer_recognizing_cb)
             speech_recognizer.recognized.connect(update_final_text)
             speech_recognizer.session_started.connect(
-                lambda evt: logger.info(f"SESSION STARTED: {evt}")
+                speech_recognizer_session_started_cb
             )
             speech_recognizer.session_stopped.connect(
-                lambda evt: logger.info(f"SESSION STOPPED {evt}")
-            )
-            speech_recognizer.canceled.connect(
-                lambda evt: logger.info(f"CANCELED {evt}")
+                speech_recognizer_session_stopped_cb
             )
+            speech_recognizer.canceled.connect(speech_recognizer_canceled_cb)
             speech_recognizer.session_stopped.connect(stop_cb)
             speech_recognizer.canceled.connect(stop_cb)
 
             speech_recognizer.start_continuous_recognition()
 
+            # Pace pushes at 1x real-time against a monotonic clock so sleep jitter
+            # does not accumulate and the SDK's client buffer is never over-filled.
+            frame_rate = wav_fh.getframerate()
+            frames_per_chunk = frame_rate // 10
+            chunk_seconds = frames_per_chunk / frame_rate
+            pushed_seconds = 0.0
+            start_time = time.monotonic()
+
+            # Bind per-chunk lookups once, outside the loop
+            is_stereo = wav_fh.getnchannels() == 2
+            read_frames = wav_fh.readframes
+            write = stream.write
+            monotonic = time.monotonic
+
             while not done:
-                frames = wav_fh.readframes(wav_fh.getframerate() // 10)
+                frames = read_frames(frames_per_chunk)
                 if not frames:
                     break
 
-                if wav_fh.getnchannels() == 2:
+                if (
+                    flow_control
+                    and pushed_bytes - processed_bytes > max_in_flight_bytes
+                ):
+                    logger.warning(
+                        "Speech service is behind, pausing push until the buffer drains."
+                    )
+                    stall_deadline = time.monotonic() + stall_timeout_seconds
+                    while (
+                        not done
+                        and pushed_bytes - processed_bytes > max_in_flight_bytes
+                        and time.monotonic() < stall_deadline
+                    ):
+                        time.sleep(0.1)
+                    if pushed_bytes - processed_bytes > max_in_flight_bytes:
+                        # Pausing again on every chunk would stretch the push indefinitely,
+                        # so the rest of the file is pushed at real-time pace
+                        logger.warning(
+                            f"Speech service did not catch up within {stall_timeout_seconds}s, "
+                            "pushing the remaining audio without flow control."
+                        )
+                        flow_control = False
+                    # Restart pacing from now so the pause is not pushed as a burst
+                    pushed_seconds = 0.0
+                    start_time = time.monotonic()
+
+                if is_stereo:
                     try:
                         # Interpreting the stereo frame data
                         stereo_data = np.frombuffer(frames, dtype=np.int16)
-                        logger.info(f"Stereo data shape: {stereo_data.shape}")
                         # The reshape(-1, 2) method is used to ensure that the stereo data
                         # is reshaped into a 2-column array (representing left and right channels).
                         # Then, the mean is calculated across the columns (axis=1) to produce the
@@ -354,19 +563,21 @@ class SpeechCoreTranslator:
                         mono_data = (
                             stereo_data.reshape(-1, 2).mean(axis=1).astype(np.int16)
                         )
-                        logger.info(f"Mono data shape: {mono_data.shape}")
                         # Convert mono_data back to bytes
                         mono_frames = mono_data.tobytes()
-                        stream.write(mono_frames)
+                        write(mono_frames)
+                        pushed_bytes += len(mono_frames)
                     except Exception as e:
                         logger.error(f"Error during stereo to mono conversion: {e}")
                 else:
-                    mono_data = np.frombuffer(frames, dtype=np.int16)
-                    logger.info(f"Mono data shape: {mono_data.shape}")
-                    mono_frames = mono_data.tobytes()
-                    stream.write(mono_frames)
-
-                time.sleep(0.1)
+                    # Mono frames are already in the format the stream expects
+                    write(frames)
+                    pushed_bytes += len(frames)
+
+                pushed_seconds += chunk_seconds
+                delay = start_time + pushed_seconds - monotonic()
+                if delay > 0:
+                    time.sleep(delay)
         except Exception as e:
             logger.error(f"An error occurred: {e}")
         finally:
@@ -419,25 +630,13 @@ class SpeechCoreTranslator:
         :param stop_cb: Callback function for stopping recognition.
         """
         logger.info("Setting up recognition callbacks...")
-        speech_recognizer.recognizing.connect(
-            lambda evt: logger.info(f"RECOGNIZING: {evt}")
-        )
-        speech_recognizer.recognized.connect(
-            lambda evt: logger.info(
-                f"RECOGNIZED: {evt.result.text}, Language: {evt.result.language}"
-            )
-        )
+        speech_recognizer.recognizing.connect(speech_recognizer_recognizing_cb)
+        speech_recognizer.recognized.connect(speech_recognizer_recognized_cb)
         speech_recognizer.recognized.connect(update_final_text)
-        speech_recognizer.session_started.connect(
-            lambda evt: logger.info(f"SESSION STARTED: {evt}")
-        )
-        speech_recognizer.session_stopped.connect(
-            lambda evt: logger.info(f"SESSION STOPPED {evt}")
-        )
-        speech_recognizer.canceled.connect(lambda evt: logger.info(f"CANCELED {evt}"))
-        speech_recognizer.canceled.connect(
-            lambda evt: logger.info(f"RECOGNITION CANCELED: {evt.result.reason}")
-        )
+        speech_recognizer.session_started.connect(speech_recognizer_session_started_cb)
+        speech_recognizer.session_stopped.connect(speech_recognizer_session_stopped_cb)
+        speech_recognizer.canceled.connect(speech_recognizer_canceled_cb)
+        speech_recognizer.canceled.connect(speech_recognizer_recognition_canceled_cb)
         speech_recognizer.session_stopped.connect(stop_cb)
         speech_recognizer.canceled.connect(stop_cb)
 
@@ -464,139 +663,7 @@ class SpeechTranscriber(SpeechCoreTranslator):
     def __init__(self):
         super().__init__()
 
-    def transcribe_speech_from_file_continuous(
-        self,
-        file_path: Optional[str] = None,
-        blob_url: Optional[str] = None,
-        language: Optional[str] = None,
-        auto_detect_source_language: Optional[bool] = False,
-        auto_detect_supported_languages: Optional[List[str]] = None,
-        source_language_config: Optional[speechsdk.SourceLanguageConfig] = None,
-        diarization: Optional[bool] = False,
-    ) -> str:
-        """
-        ranscribes audio from a given audio configuratio with input from an audio file or a blob.
-        The audio source can be either a local file or a blob in Azure Blob Storage.
-        The method supports language auto-detection and speaker diarization.
-        If diarization is enabled, the transcribed text will include speaker identification.
-
-        :param file_path: Path to the local audio file. This parameter is optional.
-        :param blob_url: URL of the blob containing the audio file. This parameter is optional.
-        :param language: Language code for speech recognition (e.g., 'en-US'). This parameter is optional.
-        :param auto_detect_source_language: If set to True, the source language will be automatically detected from the audio. This parameter is optional.
-        :param auto_detect_supported_languages: List of language codes that are supported for auto-detection (e.g., ['en-US', 'fr-FR']).
-                This parameter is optional.
-        :param source_language_config: Configuration for source language. This parameter is optional.
-        :param diarization: If set to True, the speaker diarization will be performed, which distinguishes different speakers in the audio.
-                This parameter is optional.
-        :return: Transcribed text from the audio source.
-        :raises ValueError: If neither file_path nor blob_url is provided, or if both language and auto_detect_source_language are provided.
-        """
-        self._validate_inputs(
-            file_path, blob_url, language, auto_detect_source_language
-        )
-
-        if auto_detect_source_language:
-            auto_detect_source_language_config = (
-                speechsdk.languageconfig.AutoDetectSourceLanguageConfig(
-                    languages=auto_detect_supported_languages
-                    if auto_detect_supported_languages is not None
-                    else self.supported_languages
-                )
-            )
-        else:
-            auto_detect_source_language_config = None
-
-        if file_path:
-            return self._transcribe_from_file(
-                file_path,
-                language,
-                source_language_config,
-                auto_detect_source_language_config,
-                diarization,
-            )
-
-        return self._transcribe_from_blob(
-            blob_url,
-            language,
-            source_language_config,
-            auto_detect_source_language_config,
-            diarization,
-        )
-
-    def _transcribe_from_file(
-        self,
-        file_path: str,
-        language: str,
-        source_language_config,
-        auto_detect_source_language_config,
-        diarization: bool = False,
-    ) -> str:
-        """
-        Helper function to transcribe from a local file.
-
-        :param file_path: Path to the audio file.
-        :param language: Language code for speech recognition.
-        :param source_language_config: Configuration for source language.
-        :param auto_detect_source_language_config: Configuration for auto detecting source language.
-        :return: Transcribed text.
-        """
-        # Check if the path is absolute, if not convert it to absolute path
-        if not os.path.isabs(file_path):
-            file_path = os.path.abspath(file_path)
-        audio_config = speechsdk.AudioConfig(filename=file_path)
-        return self._transcribe(
-            audio_config,
-            language,
-            source_language_config,
-            auto_detect_source_language_config,
-            diarization,
-        )
-
-    def _transcribe_from_blob(
-        self,
-        blob_url: str,
-        language: str,
-        source_language_config,
-        auto_detect_source_language_config,
-        diarization: bool = False,
-    ) -> str:
-        """
-        Helper function to transcribe from a blob.
-
-        :param blob_url: URL of the blob containing the audio file.
-        :param language: Language code for speech recognition.
-        :param source_language_config: Configuration for source language.
-        :param auto_detect_source_language_config: Configuration for auto detecting source language.
-        :return: Transcribed text, or None if blob client could not be created.
-        """
-        blob_client = self.get_blob_client_from_url(blob_url)
-        if blob_client is None:
-            return None
-
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            download_stream = blob_client.download_blob()
-            temp_file.write(download_stream.readall())
-            audio_config = speechsdk.AudioConfig(filename=temp_file.name)
-
-        try:
-            result = self._transcribe(
-                audio_config,
-                language,
-                source_language_config,
-                auto_detect_source_language_config,
-                diarization,
-            )
-        finally:
-            try:
-                os.remove(temp_file.name)
-                logger.info(f"Deleted temporary file: {temp_file.name}")
-            except OSError as e:
-                logger.warning(f"Error deleting temporary file: {e}")
-
-        return result
-
-    def _transcribe(
+    def _run_recognition(
         self,
         audio_config: AudioConfig,
         language: Optional[str],
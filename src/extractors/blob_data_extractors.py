@@ -1,23 +1,194 @@
 """This class manages interactions with Azure Blob Storage, providing functionalities to read, write,
  and extract data and metadata from blobs in various file formats."""
+import asyncio
+import importlib.util
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from io import BytesIO
-from typing import Dict, List, Literal, Optional, Union
+from typing import IO, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 import pandas as pd
-from azure.storage.blob import BlobServiceClient
+import requests
+from azure.core.pipeline.transport import RequestsTransport
+from azure.storage.blob import (
+    BlobClient,
+    BlobSasPermissions,
+    BlobServiceClient,
+    ContainerClient,
+    generate_blob_sas,
+)
+from azure.storage.blob.aio import BlobServiceClient as AsyncBlobServiceClient
 from dateutil.relativedelta import relativedelta
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 from src.extractors.base import DataExtractor
 from src.extractors.utils import get_container_and_blob_name_from_url
+from src.utils import load_env_once
 from utils.ml_logging import get_logger
 
 # Initialize logger
 logger = get_logger()
 
+# Downloads larger than this are spooled to a temporary file while being parsed
+_CSV_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# pyarrow is optional; when present, CSVs are parsed with its multi-threaded reader
+_PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# read_csv options the PyArrow engine rejects; when any is given, the C parser is kept
+_PYARROW_UNSUPPORTED_CSV_OPTIONS = frozenset(
+    {
+        "chunksize",
+        "iterator",
+        "skipfooter",
+        "low_memory",
+        "nrows",
+        "float_precision",
+        "thousands",
+        "memory_map",
+        "dialect",
+        "on_bad_lines",
+        "delim_whitespace",
+        "quoting",
+        "lineterminator",
+        "converters",
+        "dayfirst",
+        "verbose",
+        "skipinitialspace",
+        "comment",
+    }
+)
+
+# Default number of parallel range requests used for single-blob downloads
+_DOWNLOAD_MAX_CONCURRENCY = min(16, (os.cpu_count() or 4) * 2)
+
+# Size of the keep-alive connection pool shared by every sync Blob Storage client
+_HTTP_POOL_MAXSIZE = 64
+
+# Minimum number of blobs in one container for extract_metadata_batch to list the container
+# instead of requesting each blob's properties
+_METADATA_LISTING_MIN_BLOBS = 50
+
+# Builds the look-back window used by list_updated_files for each supported time unit
+_TIME_UNIT_DELTAS: Dict[str, Callable[[int], Union[timedelta, relativedelta]]] = {
+    "years": lambda n: relativedelta(years=n),
+    "months": lambda n: relativedelta(months=n),
+    "days": lambda n: timedelta(days=n),
+    "hours": lambda n: timedelta(hours=n),
+    "minutes": lambda n: timedelta(minutes=n),
+    "seconds": lambda n: timedelta(seconds=n),
+}
+
+
+class _BufferWriter:
+    """
+    Minimal seekable writer over a preallocated buffer.
+
+    Lets the Blob SDK write parallel range downloads directly into a buffer sized
+    from the blob, instead of growing a BytesIO and copying it out afterwards.
+    """
+
+    def __init__(self, buffer: bytearray):
+        self._view = memoryview(buffer)
+        self._position = 0
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += len(self._view)
+        self._position = offset
+        return offset
+
+    def write(self, data: bytes) -> int:
+        end = self._position + len(data)
+        self._view[self._position : end] = data
+        self._position = end
+        return len(data)
+
+
+def _drop_page_cache(fd: int) -> None:
+    """
+    Flushes a written file and asks the kernel to evict its pages from the page cache.
+
+    Used for large temp-file batches that are read back later, so the cached copies
+    do not compete with the OCR and parsing workloads for memory. Does nothing on
+    platforms without posix_fadvise.
+
+    :param fd: File descriptor of the written file.
+    """
+    if hasattr(os, "posix_fadvise"):
+        # Dirty pages cannot be evicted, so write them out first
+        os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+@lru_cache(maxsize=1)
+def _get_http_transport() -> RequestsTransport:
+    """
+    Returns the HTTP transport shared by every sync Blob Storage client in the process.
+
+    The default requests pool keeps only 10 connections per host, fewer than the parallel
+    range downloads and worker threads used here, so extra connections would be opened
+    and discarded on every batch. The shared pool keeps them alive instead.
+
+    :return: The cached RequestsTransport.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_HTTP_POOL_MAXSIZE, pool_maxsize=_HTTP_POOL_MAXSIZE
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return RequestsTransport(session=session, session_owner=False)
+
+
+@lru_cache(maxsize=8)
+def get_blob_service_client(
+    connect_str: str, max_chunk_get_size: Optional[int] = None
+) -> BlobServiceClient:
+    """
+    Returns the process-wide BlobServiceClient for the connection string.
+
+    Every extractor instance, and any other module that needs a sync client, should go through
+    this factory so the HTTP pipeline and connection pool are built once and stay warm.
+
+    :param connect_str: Azure Storage connection string.
+    :param max_chunk_get_size: Size in bytes of each range request made by parallel downloads.
+                               If not provided, the SDK default is used.
+    :return: The cached BlobServiceClient.
+    """
+    client_kwargs = {"transport": _get_http_transport()}
+    if max_chunk_get_size is not None:
+        client_kwargs["max_chunk_get_size"] = max_chunk_get_size
+    return BlobServiceClient.from_connection_string(connect_str, **client_kwargs)
+
+
+@lru_cache(maxsize=32)
+def _get_container_client(
+    connect_str: str, container_name: str, max_chunk_get_size: Optional[int] = None
+) -> ContainerClient:
+    """
+    Returns a ContainerClient for the container, built from the shared BlobServiceClient.
+
+    :param connect_str: Azure Storage connection string.
+    :param container_name: Name of the Azure Blob Storage container.
+    :param max_chunk_get_size: Size in bytes of each range request made by parallel downloads.
+    :return: The cached ContainerClient.
+    """
+    return get_blob_service_client(
+        connect_str, max_chunk_get_size
+    ).get_container_client(container_name)
+
 
 class AzureBlobDataExtractor(DataExtractor):
     """
@@ -30,15 +201,23 @@ class AzureBlobDataExtractor(DataExtractor):
         container_client: Azure Container Client specific to the container.
     """
 
-    def __init__(self, container_name: Optional[str] = None):
+    def __init__(
+        self,
+        container_name: Optional[str] = None,
+        max_concurrency: int = _DOWNLOAD_MAX_CONCURRENCY,
+        max_chunk_get_size: Optional[int] = None,
+    ):
         """
         Initialize the AzureBlobManager with a container name.
 
         Args:
             container_name (str, optional): Name of the Azure Blob Storage container. Defaults to None.
+            max_concurrency (int, optional): Number of parallel range requests used to download a single blob.
+                Defaults to twice the CPU count, capped at 16.
+            max_chunk_get_size (int, optional): Size in bytes of each range request. Defaults to the SDK default.
         """
         try:
-            load_dotenv()
+            load_env_once()
             connect_str = os.getenv("AZURE_STORAGE_CONNECTION_STRING")
             if connect_str is None:
                 logger.error(
@@ -47,16 +226,20 @@ class AzureBlobDataExtractor(DataExtractor):
                 raise EnvironmentError(
                     "AZURE_STORAGE_CONNECTION_STRING not found in environment variables."
                 )
+            self.connect_str = connect_str
             self.container_name = container_name
-            self.blob_service_client = BlobServiceClient.from_connection_string(
-                connect_str
+            self.max_concurrency = max_concurrency
+            self.max_chunk_get_size = max_chunk_get_size
+            self.blob_service_client = get_blob_service_client(
+                connect_str, max_chunk_get_size
             )
+            self._blob_client_cache: Dict[Tuple[str, str], BlobClient] = {}
             if container_name:
-                self.container_client = self.blob_service_client.get_container_client(
-                    container_name
+                self.container_client = _get_container_client(
+                    connect_str, container_name, max_chunk_get_size
                 )
         except Exception as e:
-            logger.error(f"Error initializing AzureBlobManager: {e}")
+            logger.error("Error initializing AzureBlobManager: %s", e)
             raise
 
     def change_container(self, new_container_name: str):
@@ -67,35 +250,191 @@ class AzureBlobDataExtractor(DataExtractor):
             new_container_name (str): The name of the new container.
         """
         self.container_name = new_container_name
-        self.container_client = self.blob_service_client.get_container_client(
-            new_container_name
+        self.container_client = _get_container_client(
+            self.connect_str, new_container_name, self.max_chunk_get_size
         )
-        logger.info(f"Container changed to {new_container_name}")
+        logger.info("Container changed to %s", new_container_name)
+
+    def _get_blob_client(self, container_name: str, blob_name: str) -> BlobClient:
+        """
+        Returns the BlobClient for a blob, reusing the one built on a previous call.
+
+        New clients are derived from the per-container client cache rather than from
+        the service client.
+
+        :param container_name: Name of the container holding the blob.
+        :param blob_name: Name of the blob.
+        :return: The cached BlobClient.
+        """
+        key = (container_name, blob_name)
+        blob_client = self._blob_client_cache.get(key)
+        if blob_client is None:
+            # Build from the cached ContainerClient, which already carries the container URL
+            blob_client = _get_container_client(
+                self.connect_str, container_name, self.max_chunk_get_size
+            ).get_blob_client(blob_name)
+            self._blob_client_cache[key] = blob_client
+        return blob_client
 
     def extract_content(self, file_path: str) -> bytes:
         """
-        Downloads blobs from a container.
+        Downloads a blob from a container.
+
+        The blob is fetched with parallel range requests written directly into a buffer
+        preallocated to the blob's size.
 
-        :param filenames: List of filenames to be downloaded from the blob.
-        :return: List of BytesIO objects representing the downloaded blobs.
+        :param file_path: URL of the blob to be downloaded.
+        :return: Bytes-like content of the downloaded blob.
         """
         (
             container_name,
             file_name,
         ) = get_container_and_blob_name_from_url(file_path)
         try:
-            blob_data = (
-                self.blob_service_client.get_blob_client(
-                    container=container_name, blob=file_name
-                )
-                .download_blob()
-                .readall()
+            downloader = self._get_blob_client(container_name, file_name).download_blob(
+                max_concurrency=self.max_concurrency
             )
-            logger.info(f"Successfully downloaded blob file {file_name}")
+            blob_data = bytearray(downloader.size)
+            downloader.readinto(_BufferWriter(blob_data))
+            logger.info("Successfully downloaded blob file %s", file_name)
         except Exception as e:
-            logger.error(f"Failed to download blob file {file_name}: {e}")
+            logger.error("Failed to download blob file %s: %s", file_name, e)
         return blob_data
 
+    def generate_blob_sas_url(
+        self, blob_url: str, expiry_minutes: int = 15
+    ) -> Optional[str]:
+        """
+        Builds a short-lived, read-only SAS URL for a blob.
+
+        Lets services such as Document Intelligence fetch the blob directly from storage
+        instead of having its content downloaded here and uploaded again.
+
+        :param blob_url: URL of the blob.
+        :param expiry_minutes: Number of minutes the SAS token stays valid. Defaults to 15.
+        :return: The blob URL with a SAS token, or None if the client was not created with an account key.
+        """
+        account_key = getattr(self.blob_service_client.credential, "account_key", None)
+        if account_key is None:
+            return None
+        container_name, blob_name = get_container_and_blob_name_from_url(blob_url)
+        sas_token = generate_blob_sas(
+            account_name=self.blob_service_client.account_name,
+            container_name=container_name,
+            blob_name=blob_name,
+            account_key=account_key,
+            permission=BlobSasPermissions(read=True),
+            expiry=datetime.now(timezone.utc) + timedelta(minutes=expiry_minutes),
+        )
+        blob_client = self._get_blob_client(container_name, blob_name)
+        return f"{blob_client.url}?{sas_token}"
+
+    async def _download_many(
+        self, targets: List[Tuple[str, str]], max_concurrency: int
+    ) -> List[Optional[bytes]]:
+        """
+        Downloads several blobs concurrently using the async Blob Storage SDK.
+
+        One async BlobServiceClient is shared by all downloads in the batch, and the number of
+        downloads in flight is bounded by `max_concurrency`.
+
+        :param targets: List of (container name, blob name) pairs to download.
+        :param max_concurrency: Maximum number of concurrent downloads.
+        :return: List of blob contents in the same order as `targets`; None for blobs that failed to download.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async with AsyncBlobServiceClient.from_connection_string(
+            self.connect_str
+        ) as service_client:
+
+            async def _download(container_name: str, blob_name: str) -> bytearray:
+                async with semaphore:
+                    blob_client = service_client.get_blob_client(
+                        container=container_name, blob=blob_name
+                    )
+                    download_stream = await blob_client.download_blob()
+                    # Read into a buffer preallocated to the blob's size, as extract_content
+                    # does, instead of readall() joining the chunks into a second copy
+                    blob_data = bytearray(download_stream.size)
+                    await download_stream.readinto(_BufferWriter(blob_data))
+                    return blob_data
+
+            results = await asyncio.gather(
+                *(_download(container, blob) for container, blob in targets),
+                return_exceptions=True,
+            )
+
+        blob_data: List[Optional[bytes]] = []
+        for (_, blob_name), result in zip(targets, results):
+            if isinstance(result, BaseException):
+                logger.error("Failed to download blob file %s: %s", blob_name, result)
+                blob_data.append(None)
+            else:
+                logger.info("Successfully downloaded blob file %s", blob_name)
+                blob_data.append(result)
+        return blob_data
+
+    def extract_content_to_stream(self, file_path: str, stream: IO[bytes]) -> int:
+        """
+        Downloads a blob straight into a writable file-like object.
+
+        The blob is fetched with parallel range requests and written as it arrives, so it is
+        never buffered in memory as a whole. Errors are raised to the caller.
+
+        :param file_path: URL of the blob to be downloaded.
+        :param stream: Writable binary stream, e.g. an open temporary file.
+        :return: Number of bytes written.
+        """
+        container_name, file_name = get_container_and_blob_name_from_url(file_path)
+        downloader = self._get_blob_client(container_name, file_name).download_blob(
+            max_concurrency=self.max_concurrency
+        )
+        bytes_written = downloader.readinto(stream)
+        logger.info("Successfully downloaded blob file %s", file_name)
+        return bytes_written
+
+    async def extract_contents(
+        self, file_paths: List[str], max_concurrency: int = 32
+    ) -> List[Optional[bytes]]:
+        """
+        Downloads several blobs concurrently using the async Blob Storage SDK.
+
+        :param file_paths: List of blob URLs to download.
+        :param max_concurrency: Maximum number of concurrent downloads.
+        :return: List of blob contents in the same order as `file_paths`; None for blobs that failed to download.
+        """
+        targets = [get_container_and_blob_name_from_url(path) for path in file_paths]
+        return await self._download_many(targets, max_concurrency)
+
+    async def download_blob_files(
+        self,
+        filenames: List[str],
+        container_name: Optional[str] = None,
+        max_concurrency: int = 32,
+    ) -> List[Optional[BytesIO]]:
+        """
+        Downloads several blobs from a container concurrently.
+
+        The downloads overlap on the event loop, so a batch of small blobs costs roughly one
+        round-trip instead of one per blob. The result can be passed straight to
+        `write_blob_data_to_temp_files`.
+
+        :param filenames: Names of the blobs to download.
+        :param container_name: Name of the container. If not provided, uses the container name from the instance.
+        :param max_concurrency: Maximum number of concurrent downloads.
+        :return: List of BytesIO objects in the same order as `filenames`; None for blobs that failed to download.
+        :raises ValueError: If no container name is available.
+        """
+        container_name = container_name or self.container_name
+        if container_name is None:
+            raise ValueError(
+                "Container name must be provided either as an argument or as a default in the class."
+            )
+        targets = [(container_name, filename) for filename in filenames]
+        blob_data = await self._download_many(targets, max_concurrency)
+        return [BytesIO(data) if data is not None else None for data in blob_data]
+
     def extract_metadata(self, blob_url: str) -> Dict[str, Optional[Union[str, int]]]:
         """
         Extracts metadata from a blob in Azure Blob Storage.
@@ -105,24 +444,138 @@ class AzureBlobDataExtractor(DataExtractor):
         """
         container_name, blob_name = get_container_and_blob_name_from_url(blob_url)
         try:
-            blob_client = self.blob_service_client.get_blob_client(
-                container=container_name, blob=blob_name
-            )
+            blob_client = self._get_blob_client(container_name, blob_name)
             blob_properties = blob_client.get_blob_properties()
-
-            # Extracting available metadata
-            return {
-                "source_url": blob_url,
-                "name": blob_name,
-                "size": blob_properties.size,
-                "content_type": blob_properties.content_settings.content_type,
-                "last_modified": blob_properties.last_modified,
-                # Add other properties as needed
-            }
+            return self._metadata_from_properties(blob_url, blob_name, blob_properties)
         except Exception as e:
-            logger.error(f"Failed to extract metadata for blob {blob_name}: {e}")
+            logger.error("Failed to extract metadata for blob %s: %s", blob_name, e)
             return {}
 
+    async def extract_metadata_many(
+        self, blob_urls: List[str], max_concurrency: int = 32
+    ) -> List[Dict[str, Optional[Union[str, int]]]]:
+        """
+        Extracts metadata for several blobs concurrently using the async Blob Storage SDK.
+
+        The property requests are issued as one overlapped batch over a shared async
+        BlobServiceClient instead of one blocking request per URL.
+
+        :param blob_urls: List of blob URLs.
+        :param max_concurrency: Maximum number of concurrent property requests.
+        :return: List of metadata dictionaries in the same order as `blob_urls`; empty for blobs that failed.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async with AsyncBlobServiceClient.from_connection_string(
+            self.connect_str
+        ) as service_client:
+
+            async def _fetch(blob_url: str) -> Dict[str, Optional[Union[str, int]]]:
+                container_name, blob_name = get_container_and_blob_name_from_url(
+                    blob_url
+                )
+                async with semaphore:
+                    try:
+                        blob_client = service_client.get_blob_client(
+                            container=container_name, blob=blob_name
+                        )
+                        blob_properties = await blob_client.get_blob_properties()
+                        return self._metadata_from_properties(
+                            blob_url, blob_name, blob_properties
+                        )
+                    except Exception as e:
+                        logger.error(
+                            "Failed to extract metadata for blob %s: %s", blob_name, e
+                        )
+                        return {}
+
+            return await asyncio.gather(*(_fetch(url) for url in blob_urls))
+
+    def extract_metadata_batch(
+        self, blob_urls: List[str]
+    ) -> Dict[str, Dict[str, Optional[Union[str, int]]]]:
+        """
+        Extracts metadata for several blobs with container listings instead of per-blob requests.
+
+        URLs are grouped by container. When a container has at least 50 requested blobs and
+        their names share a prefix, the container is listed once, restricted to that prefix;
+        a listing page returns the properties of up to 5000 blobs. Otherwise, listing could
+        walk far more blobs than requested, so the properties are fetched per blob on a thread pool.
+
+        :param blob_urls: List of blob URLs.
+        :return: Dictionary mapping each blob URL to its metadata; empty for blobs that were not found.
+        """
+        urls_by_container: Dict[str, Dict[str, List[str]]] = {}
+        for blob_url in blob_urls:
+            container_name, blob_name = get_container_and_blob_name_from_url(blob_url)
+            urls_by_container.setdefault(container_name, {}).setdefault(
+                blob_name, []
+            ).append(blob_url)
+
+        metadata: Dict[str, Dict[str, Optional[Union[str, int]]]] = {
+            blob_url: {} for blob_url in blob_urls
+        }
+        individual_urls = []
+        for container_name, urls_by_name in urls_by_container.items():
+            prefix = os.path.commonprefix(list(urls_by_name))
+            if not prefix or len(urls_by_name) < _METADATA_LISTING_MIN_BLOBS:
+                individual_urls += [
+                    url for urls in urls_by_name.values() for url in urls
+                ]
+                continue
+
+            container_client = _get_container_client(
+                self.connect_str, container_name, self.max_chunk_get_size
+            )
+            try:
+                for blob in container_client.list_blobs(name_starts_with=prefix):
+                    for blob_url in urls_by_name.get(blob.name, ()):
+                        metadata[blob_url] = self._metadata_from_properties(
+                            blob_url, blob.name, blob
+                        )
+            except Exception as e:
+                logger.error(
+                    "Failed to list blobs in container %s: %s", container_name, e
+                )
+            for urls in urls_by_name.values():
+                for blob_url in urls:
+                    if not metadata[blob_url]:
+                        logger.error("Failed to extract metadata for blob %s", blob_url)
+
+        if individual_urls:
+            # extract_metadata logs its own failures
+            with ThreadPoolExecutor(
+                max_workers=min(32, len(individual_urls))
+            ) as executor:
+                for blob_url, blob_metadata in zip(
+                    individual_urls,
+                    executor.map(self.extract_metadata, individual_urls),
+                ):
+                    metadata[blob_url] = blob_metadata
+        return metadata
+
+    @staticmethod
+    def _metadata_from_properties(
+        blob_url: str, blob_name: str, blob_properties
+    ) -> Dict[str, Optional[Union[str, int]]]:
+        """
+        Builds the metadata dictionary returned by extract_metadata from blob properties.
+
+        :param blob_url: URL of the blob.
+        :param blob_name: Name of the blob.
+        :param blob_properties: BlobProperties returned by the Blob Storage SDK, either from
+                                get_blob_properties or from a container listing.
+        :return: Dictionary with metadata.
+        """
+        return {
+            "source_url": blob_url,
+            "name": blob_name,
+            "size": blob_properties.size,
+            "content_type": blob_properties.content_settings.content_type,
+            "last_modified": blob_properties.last_modified,
+            # Add other properties as needed
+        }
+
     def format_metadata(self, metadata: Dict) -> Dict:
         """
         Format and return file metadata.
@@ -144,28 +597,161 @@ class AzureBlobDataExtractor(DataExtractor):
         return formatted_metadata
 
     def write_blob_data_to_temp_files(
-        self, blob_data: List[BytesIO], filenames: List[str]
+        self,
+        blob_data: List[Optional[BytesIO]],
+        filenames: List[str],
+        drop_page_cache: bool = False,
     ) -> List[str]:
         """
         Writes blobs to temporary files.
 
-        :param blob_data: List of BytesIO objects representing the blobs.
+        :param blob_data: List of BytesIO objects representing the blobs. None entries are skipped.
         :param filenames: List of filenames corresponding to the blobs.
+        :param drop_page_cache: Evict each written file from the page cache. Useful for large batches
+                                in long-running processes. Defaults to False.
         :return: List of paths to the temporary files.
         """
         temp_dir = tempfile.mkdtemp()
-        temp_files = []
-        for i, byteio in enumerate(blob_data):
+
+        def _write_one(byteio: Optional[BytesIO], filename: str) -> Optional[str]:
+            if byteio is None:
+                # The blob failed to download; there is nothing to write
+                return None
+            file_path = os.path.join(temp_dir, filename)
             try:
-                file_path = os.path.join(temp_dir, filenames[i])
-                with open(file_path, "wb") as file:
-                    file.write(byteio.getbuffer())
-                temp_files.append(file_path)
+                fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                try:
+                    # Write straight from the BytesIO buffer without an intermediate copy
+                    with byteio.getbuffer() as view:
+                        written = 0
+                        while written < len(view):
+                            written += os.write(fd, view[written:])
+                    if drop_page_cache:
+                        _drop_page_cache(fd)
+                finally:
+                    os.close(fd)
+                return file_path
             except Exception as e:
                 logger.error(
-                    f"Failed to write blob data to temp file {filenames[i]}: {e}"
+                    "Failed to write blob data to temp file %s: %s", filename, e
                 )
-        return temp_files
+                return None
+
+        if not blob_data:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(8, len(blob_data))) as executor:
+            results = executor.map(_write_one, blob_data, filenames)
+            return [file_path for file_path in results if file_path is not None]
+
+    def write_blob_data_to_single_file(
+        self, blob_data: List[BytesIO], filenames: List[str], out_path: str
+    ) -> List[Tuple[str, int, int]]:
+        """
+        Writes blobs back to back into one file and returns an index of where each one lives.
+
+        Meant for staging many small blobs: all buffers go out through scatter-gather writev
+        calls on a single file descriptor, instead of one open/write/close per blob. Use
+        `write_blob_data_to_temp_files` when distinct paths are needed.
+
+        :param blob_data: List of BytesIO objects representing the blobs.
+        :param filenames: List of filenames corresponding to the blobs.
+        :param out_path: Path of the file to write.
+        :return: List of (filename, offset, size) tuples, one per blob, in input order.
+        """
+        views = [byteio.getbuffer() for byteio in blob_data]
+        index = []
+        offset = 0
+        for filename, view in zip(filenames, views):
+            index.append((filename, offset, len(view)))
+            offset += len(view)
+
+        fd = os.open(out_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            if hasattr(os, "writev"):
+                iov_max = os.sysconf("SC_IOV_MAX") if hasattr(os, "sysconf") else 1024
+                pending = [view for view in views if len(view)]
+                while pending:
+                    batch = pending[:iov_max]
+                    written = os.writev(fd, batch)
+                    # writev may stop early; drop the buffers it finished and trim the partial one
+                    done = 0
+                    while done < len(batch) and written >= len(batch[done]):
+                        written -= len(batch[done])
+                        done += 1
+                    pending = pending[done:]
+                    if written:
+                        pending[0] = pending[0][written:]
+            else:
+                for view in views:
+                    written = 0
+                    while written < len(view):
+                        written += os.write(fd, view[written:])
+        finally:
+            os.close(fd)
+            for view in views:
+                view.release()
+        logger.info("Wrote %d blobs to %s", len(index), out_path)
+        return index
+
+    def download_blobs_to_temp_files(
+        self,
+        filenames: List[str],
+        container_name: Optional[str] = None,
+        drop_page_cache: bool = False,
+    ) -> List[str]:
+        """
+        Downloads blobs from a container straight into temporary files.
+
+        Each download is streamed into its target file, so a blob is never held in memory
+        as a whole. Blobs are downloaded in parallel.
+
+        :param filenames: Names of the blobs to download.
+        :param container_name: Name of the container. If not provided, uses the container name from the instance.
+        :param drop_page_cache: Evict each written file from the page cache. Useful for large batches
+                                in long-running processes. Defaults to False.
+        :return: List of paths to the temporary files, laid out like the blob names under a fresh
+                 temporary directory; blobs that failed to download are omitted.
+        :raises ValueError: If no container name is available.
+        """
+        container_name = container_name or self.container_name
+        if container_name is None:
+            raise ValueError(
+                "Container name must be provided either as an argument or as a default in the class."
+            )
+        if not filenames:
+            return []
+
+        temp_dir = tempfile.mkdtemp()
+
+        def _download_one(filename: str) -> Optional[str]:
+            # Keep the virtual directory so same-named blobs under different prefixes don't collide
+            relative_path = os.path.normpath(filename.lstrip("/"))
+            if relative_path == os.pardir or relative_path.startswith(
+                os.pardir + os.sep
+            ):
+                logger.error("Refusing to download blob outside temp dir: %s", filename)
+                return None
+            file_path = os.path.join(temp_dir, relative_path)
+            try:
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                blob_client = self._get_blob_client(container_name, filename)
+                with open(file_path, "wb") as file:
+                    blob_client.download_blob(
+                        max_concurrency=self.max_concurrency
+                    ).readinto(file)
+                    if drop_page_cache:
+                        file.flush()
+                        _drop_page_cache(file.fileno())
+                logger.info("Successfully downloaded blob file %s", filename)
+                return file_path
+            except Exception as e:
+                logger.error("Failed to download blob file %s: %s", filename, e)
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(8, len(filenames))) as executor:
+            results = executor.map(_download_one, filenames)
+            return [file_path for file_path in results if file_path is not None]
 
     def list_updated_files(
         self,
@@ -174,6 +760,7 @@ class AzureBlobDataExtractor(DataExtractor):
         time_unit: Optional[
             Literal["years", "months", "days", "hours", "minutes", "seconds"]
         ] = None,
+        name_starts_with: Optional[str] = None,
     ) -> list[str]:
         """
         Lists files in the blob container that have been updated since a specified time.
@@ -181,74 +768,47 @@ class AzureBlobDataExtractor(DataExtractor):
         :param container_name: Name of the blob container. If not provided, uses the container name from the instance.
         :param updated_since: Number of time units (years, months, days, hours, minutes, seconds) since which to check for updates. If not provided, returns all files. Time is in UTC.
         :param time_unit: Time unit to use when calculating the time since which to check for updates. Default is None.
+        :param name_starts_with: Only list blobs whose names start with this prefix. The filter is applied by the service. Default is None.
         :return: List of filenames of updated files.
         """
         # Get the blob container
         container_name = (
             container_name if container_name is not None else self.container_name
         )
-        container_client = self.blob_service_client.get_container_client(
-            container=container_name
+        container_client = _get_container_client(
+            self.connect_str, container_name, self.max_chunk_get_size
         )
 
         if updated_since is not None and time_unit is not None:
-            if time_unit == "years":
-                updated_since_datetime = datetime.now(timezone.utc) - relativedelta(
-                    years=updated_since
-                )
-            elif time_unit == "months":
-                updated_since_datetime = datetime.now(timezone.utc) - relativedelta(
-                    months=updated_since
-                )
-            elif time_unit == "days":
-                updated_since_datetime = datetime.now(timezone.utc) - timedelta(
-                    days=updated_since
-                )
-            elif time_unit == "hours":
-                updated_since_datetime = datetime.now(timezone.utc) - timedelta(
-                    hours=updated_since
-                )
-            elif time_unit == "minutes":
-                updated_since_datetime = datetime.now(timezone.utc) - timedelta(
-                    minutes=updated_since
-                )
-            elif time_unit == "seconds":
-                updated_since_datetime = datetime.now(timezone.utc) - timedelta(
-                    seconds=updated_since
-                )
-            else:
+            try:
+                delta = _TIME_UNIT_DELTAS[time_unit](updated_since)
+            except KeyError:
                 raise ValueError(
                     "Invalid time_unit. Must be 'years', 'months', 'days', 'hours', 'minutes', or 'seconds'."
-                )
+                ) from None
+            updated_since_datetime = datetime.now(timezone.utc) - delta
         else:
             updated_since_datetime = datetime.min.replace(tzinfo=timezone.utc)
 
-        # Get the blob container
-        container_client = self.blob_service_client.get_container_client(container_name)
-
-        # List all blobs in the container
-        blob_list = container_client.list_blobs()
+        # List the blobs in the container, filtered by prefix on the service side
+        blob_list = container_client.list_blobs(name_starts_with=name_starts_with)
 
-        updated_files = []
-        for blob in blob_list:
-            # Get the blob client
-            blob_client = container_client.get_blob_client(blob.name)
-
-            # Get the blob properties to check the last modified time
-            blob_properties = blob_client.get_blob_properties()
-
-            # Get the last modified time of the blob
-            last_modified = blob_properties.last_modified.astimezone()
-
-            # Check if the blob was updated after the specified date
-            if last_modified > updated_since_datetime:
-                # If updated, add the blob name to the list
-                updated_files.append(blob_client.url)
-
-        return updated_files
+        # The listing already carries each blob's tz-aware last modified time,
+        # so no per-blob properties request or timezone conversion is needed.
+        # get_blob_client only builds the client locally; its url quotes the blob name
+        # and places any SAS token in the query string, as the baseline returned it
+        return [
+            container_client.get_blob_client(blob.name).url
+            for blob in blob_list
+            if blob.last_modified > updated_since_datetime
+        ]
 
     def read_csv_from_blob(
-        self, blob_name: str, container_name: Optional[str] = None, **kwargs
+        self,
+        blob_name: str,
+        container_name: Optional[str] = None,
+        use_arrow: bool = False,
+        **kwargs,
     ) -> pd.DataFrame:
         """
         Reads a CSV file from Azure Blob Storage and converts it into a pandas DataFrame.
@@ -256,6 +816,10 @@ class AzureBlobDataExtractor(DataExtractor):
         :param blob_name: The name of the blob (CSV file) in Azure Blob Storage.
         :param container_name: The name of the container in Azure Blob Storage.
                                If not provided, the default container name set in the class is used.
+        :param use_arrow: Parse with pandas' multi-threaded PyArrow engine when pyarrow is installed,
+                          no other engine is requested and no option unsupported by that engine
+                          (e.g. chunksize, nrows, skipfooter) is given. Note that PyArrow may infer
+                          dtypes differently from the default C parser. Defaults to False.
         :return: A pandas DataFrame containing the data from the CSV file.
         :raises ValueError: If both the container_name argument and default_container_name attribute are None.
         """
@@ -267,13 +831,22 @@ class AzureBlobDataExtractor(DataExtractor):
             else:
                 container_name = self.container_name
 
-        blob_client = self.blob_service_client.get_blob_client(
-            container_name, blob_name
-        )
+        blob_client = self._get_blob_client(container_name, blob_name)
 
-        with BytesIO() as blob_io:
-            blob_client.download_blob().readinto(blob_io)
+        # Spool the download so large CSVs spill to disk instead of being held in memory
+        # next to the DataFrame built from them
+        with tempfile.SpooledTemporaryFile(max_size=_CSV_SPOOL_MAX_SIZE) as blob_io:
+            blob_client.download_blob(max_concurrency=self.max_concurrency).readinto(
+                blob_io
+            )
             blob_io.seek(0)  # Go to the start of the stream
+            if (
+                use_arrow
+                and _PYARROW_AVAILABLE
+                and "engine" not in kwargs
+                and _PYARROW_UNSUPPORTED_CSV_OPTIONS.isdisjoint(kwargs)
+            ):
+                kwargs["engine"] = "pyarrow"
             df = pd.read_csv(blob_io, **kwargs)
 
         return df
@@ -1,12 +1,19 @@
 import io
-
-from docx import Document
+import zipfile
+from xml.etree.ElementTree import iterparse
 
 from utils.ml_logging import get_logger
 
 # Initialize logging
 logger = get_logger()
 
+# WordprocessingML tags read while streaming word/document.xml
+_W_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_PARAGRAPH = f"{_W_NAMESPACE}p"
+_W_TEXT = f"{_W_NAMESPACE}t"
+_W_TAB = f"{_W_NAMESPACE}tab"
+_W_BREAKS = (f"{_W_NAMESPACE}br", f"{_W_NAMESPACE}cr")
+
 
 class DocxHelper:
     """
@@ -56,12 +63,31 @@ class DocxHelper:
         """
         Helper method to extract text from a DOCX file stream.
 
+        The document XML is streamed in a single pass instead of being loaded into a
+        python-docx object tree; each paragraph is released as soon as its text is read.
+
         :param file_stream: File stream of the DOCX file.
         :return: Extracted text from the DOCX as a string, or None if extraction fails.
         """
         try:
-            document = Document(file_stream)
-            text = [paragraph.text for paragraph in document.paragraphs]
+            text = []
+            runs = []
+            with zipfile.ZipFile(file_stream) as archive, archive.open(
+                "word/document.xml"
+            ) as document_xml:
+                for _, element in iterparse(document_xml):
+                    tag = element.tag
+                    if tag == _W_TEXT:
+                        if element.text:
+                            runs.append(element.text)
+                    elif tag == _W_TAB:
+                        runs.append("\t")
+                    elif tag in _W_BREAKS:
+                        runs.append("\n")
+                    elif tag == _W_PARAGRAPH:
+                        text.append("".join(runs))
+                        runs = []
+                        element.clear()
 
             extracted_text = "\n".join(text)
             logger.info("Text extraction from DOCX was successful.")
@@ -2,14 +2,15 @@
 This module defines the OCRDataExtractor class for extracting content and metadata from various file formats
 using Azure Document Intelligence for Optical Character Recognition (OCR).
 """
+import asyncio
 import os
 import warnings
-from typing import Any, Dict, Optional, Tuple, Union
-
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
 from src.enrichers.ocr_document_intelligence import AzureDocumentIntelligenceManager
 from src.extractors.base import DataExtractor
+from src.utils import load_env_once
 from utils.ml_logging import get_logger
 
 # Initialize logger
@@ -28,7 +29,10 @@ class OCRDataExtractor(DataExtractor):
     """
 
     def __init__(
-        self, azure_endpoint: Optional[str] = None, azure_key: Optional[str] = None
+        self,
+        azure_endpoint: Optional[str] = None,
+        azure_key: Optional[str] = None,
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize the OCRDataExtractor with Azure Document Intelligence credentials.
@@ -36,9 +40,12 @@ class OCRDataExtractor(DataExtractor):
         Args:
             azure_endpoint (str, optional): Azure Document Intelligence endpoint. Defaults to None.
             azure_key (str, optional): Azure Document Intelligence key. Defaults to None.
+            max_workers (int, optional): Number of threads used by extract_content_batch.
+                Defaults to four per CPU, capped at 32.
         """
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
         try:
-            load_dotenv()
+            load_env_once()
             azure_endpoint = azure_endpoint or os.getenv(
                 "AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT"
             )
@@ -66,14 +73,7 @@ class OCRDataExtractor(DataExtractor):
         :return: Tuple containing a dictionary representing the extracted content and the OCR result.
         """
         try:
-            self.result_ocr = self.az_intel.analyze_document(
-                document_input=file_path,
-                model_type=MODEL_TYPE,
-                output_format=output_format,
-                pages=pages,
-                features=["OCR_HIGH_RESOLUTION"],
-                **kwargs,
-            )
+            self.result_ocr = self._analyze(file_path, output_format, pages, **kwargs)
 
             # Check if result_ocr.content is empty
             if not self.result_ocr.content:
@@ -84,6 +84,125 @@ class OCRDataExtractor(DataExtractor):
             logger.error(f"Failed to extract content from file {file_path}: {e}")
         return self.result_ocr.content, self.result_ocr
 
+    def _analyze(
+        self, file_path: str, output_format: str, pages: Optional[str], **kwargs
+    ) -> Any:
+        """
+        Runs Azure Document Intelligence OCR on a file.
+
+        :param file_path: Path or URL of the file to be processed.
+        :param output_format: Desired output format of the extracted content.
+        :param pages: Pages to analyze, e.g. "1-3,5".
+        :param kwargs: Optional keyword arguments for the analyze_document method.
+        :return: The OCR result.
+        """
+        return self.az_intel.analyze_document(
+            document_input=file_path,
+            model_type=MODEL_TYPE,
+            output_format=output_format,
+            pages=pages,
+            features=["OCR_HIGH_RESOLUTION"],
+            **kwargs,
+        )
+
+    def extract_content_batch(
+        self,
+        file_paths: List[str],
+        output_format: str = "markdown",
+        pages: Optional[str] = None,
+        **kwargs,
+    ) -> Iterator[Tuple[str, Any, Any]]:
+        """
+        Extracts content from several files on a thread pool using Azure Document Intelligence.
+
+        The SDK releases the GIL while it waits on the service, so the analyses overlap.
+        Results are yielded as soon as each one completes.
+
+        :param file_paths: Paths or URLs of the files to be processed.
+        :param output_format: Desired output format of the extracted content.
+        :param pages: Pages to analyze in every file, e.g. "1-3,5".
+        :param kwargs: Optional keyword arguments for the analyze_document method.
+        :return: Iterator of (file path, content, OCR result) tuples in completion order.
+            Files that fail are logged and yield None for the content and the result.
+        """
+        if not file_paths:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(file_paths))
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._analyze, file_path, output_format, pages, **kwargs
+                ): file_path
+                for file_path in file_paths
+            }
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    result_ocr = future.result()
+                except Exception as e:
+                    logger.error(
+                        f"Failed to extract content from file {file_path}: {e}"
+                    )
+                    yield file_path, None, None
+                    continue
+                if not result_ocr.content:
+                    warnings.warn("result_ocr.content is empty")
+                else:
+                    logger.info(f"Successfully extracted content from {file_path}")
+                yield file_path, result_ocr.content, result_ocr
+
+    async def extract_content_many(
+        self,
+        file_paths: List[str],
+        output_format: str = "markdown",
+        pages: Optional[str] = None,
+        max_in_flight: int = 8,
+        **kwargs,
+    ) -> AsyncIterator[Tuple[str, Any, Any]]:
+        """
+        Extracts content from several files concurrently using Azure Document Intelligence.
+
+        Each analysis runs in a worker thread, with at most `max_in_flight` documents being
+        analyzed at once. Results are yielded as soon as each one completes, so callers can
+        start processing early results while later documents are still being analyzed.
+
+        :param file_paths: Paths or URLs of the files to be processed.
+        :param output_format: Desired output format of the extracted content.
+        :param pages: Pages to analyze in every file, e.g. "1-3,5".
+        :param max_in_flight: Maximum number of documents analyzed at the same time.
+        :param kwargs: Optional keyword arguments for the analyze_document method.
+        :return: Async iterator of (file path, content, OCR result) tuples in completion order.
+            Files that fail are logged and yield None for the content and the result.
+        """
+        semaphore = asyncio.Semaphore(max_in_flight)
+
+        async def _extract(file_path: str) -> Tuple[str, Any, Any]:
+            async with semaphore:
+                try:
+                    result_ocr = await asyncio.to_thread(
+                        self._analyze, file_path, output_format, pages, **kwargs
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to extract content from file {file_path}: {e}"
+                    )
+                    return file_path, None, None
+            if not result_ocr.content:
+                warnings.warn("result_ocr.content is empty")
+            else:
+                logger.info(f"Successfully extracted content from {file_path}")
+            return file_path, result_ocr.content, result_ocr
+
+        tasks = [asyncio.ensure_future(_extract(path)) for path in file_paths]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
     def extract_metadata(
         self, file_path: str, result_ocr: Any
     ) -> Dict[str, Optional[Union[str, int]]]:
@@ -99,9 +218,10 @@ class OCRDataExtractor(DataExtractor):
             if result_ocr is None:
                 warnings.warn("No OCR result available.")
 
+            # A tuple default avoids allocating an empty list when there are no paragraphs
             section_headings = [
                 paragraph["content"]
-                for paragraph in result_ocr.get("paragraphs", [])
+                for paragraph in result_ocr.get("paragraphs") or ()
                 if paragraph.get("role") == "sectionHeading"
             ]
 
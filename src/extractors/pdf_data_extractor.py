@@ -1,21 +1,24 @@
 import os
-from typing import List, Optional, Union
-
-from langchain.docstore.document import Document
-from langchain.document_loaders import PyPDFLoader
+from typing import TYPE_CHECKING, List, Optional, Union
 
 from src.extractors.utils import get_container_and_blob_name_from_url
-from src.loaders.base import AzureDocumentLoader
 
 # load logging
 from utils.ml_logging import get_logger
 
 logger = get_logger()
 
+if TYPE_CHECKING:
+    from langchain.docstore.document import Document
+
+# Host suffix that marks a URL as an Azure Blob Storage URL
+_BLOB_HOST = "blob.core.windows.net"
+_PDF_SUFFIX = ".pdf"
+
 
 def read_and_load(
     pdf_path: Optional[str] = None, pdf_url: Optional[str] = None, **kwargs
-) -> Union[Document, List[Document]]:
+) -> Union["Document", List["Document"]]:
     """
     Reads and loads a single PDF file from a given local path or a URL from Azure Blob Storage.
 
@@ -30,6 +33,8 @@ def read_and_load(
     :param pdf_url: URL of the PDF file in Azure Blob Storage or a local file path.
     :return: A Document object containing the content of the PDF file.
     """
+    # LangChain and the loaders are imported on first use, so importing this module
+    # does not pull in the whole document_loaders package
     if pdf_path is None and pdf_url is None:
         raise ValueError("Either 'pdf_path' or 'pdf_url' must be provided.")
 
@@ -39,24 +44,30 @@ def read_and_load(
 
         logger.info(f"Reading PDF file from {pdf_path}.")
 
-        if pdf_path.endswith(".pdf"):
-            loader = PyPDFLoader(pdf_path, **kwargs)
+        if pdf_path.endswith(_PDF_SUFFIX):
+            from src.chunkers.settings import PDF_LOADER
+
+            loader = PDF_LOADER(pdf_path, **kwargs)
             document = loader.load()
             return document
         else:
             raise ValueError("Invalid path. Path should be a .pdf file.")
     elif pdf_url:
-        if "blob.core.windows.net" in pdf_url:
+        if _BLOB_HOST in pdf_url:
             logger.info(f"Downloading and reading PDF file from {pdf_url}.")
             container_name, file_name = get_container_and_blob_name_from_url(pdf_url)
+            from src.loaders.base import AzureDocumentLoader
+
             loader = AzureDocumentLoader(container_name=container_name)
             documents = loader.load_files_from_blob(filenames=[file_name], **kwargs)
             return documents
         else:
             logger.info(f"Reading PDF file from {pdf_url}.")
 
-            if pdf_url.endswith(".pdf"):
-                loader = PyPDFLoader(pdf_url, **kwargs)
+            if pdf_url.endswith(_PDF_SUFFIX):
+                from src.chunkers.settings import PDF_LOADER
+
+                loader = PDF_LOADER(pdf_url, **kwargs)
                 document = loader.load()
                 return document
             else:
@@ -1,46 +1,125 @@
+import importlib.util
 import os
-from functools import wraps
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.utils import load_env_once
 
 # load logging
 from utils.ml_logging import get_logger
 
 logger = get_logger()
 
+# h2 is optional; when present, the async client multiplexes requests over HTTP/2
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Keep-alive connections kept per ServiceNow host by the shared session
+_POOL_MAXSIZE = 64
+
+# (connect, read) timeouts in seconds, so a dropped connection cannot hang a call forever
+_REQUEST_TIMEOUT = (3.05, 30)
+
+# Requests in flight for bulk writes; must not exceed _POOL_MAXSIZE
+_BULK_MAX_WORKERS = 16
+
+# Record numbers per bulk query, which keeps the encoded query well under URL length limits
+_BULK_QUERY_SIZE = 200
+
+# Headers sent with every ServiceNow request by the sync and async clients
+_JSON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+
+def _load_credentials(
+    instance_url: Optional[str],
+) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+    """
+    Resolves the ServiceNow instance URL and credentials from the arguments and environment.
 
-def headers_replace(f):
+    :param instance_url: ServiceNow instance URL. If not provided, SERVICENOW_URL is used.
+    :return: A tuple of (instance_url, api_token, user, password).
+    :raises EnvironmentError: If neither an API token nor a username and password are set.
     """
-    Decorator function to replace headers in the HTTP request.
+    load_env_once()
+    api_token = os.getenv("SERVICENOW_API_TOKEN")
+    user = os.getenv("SERVICENOW_USER")
+    password = os.getenv("SERVICENOW_PASSWORD")
+    if not (api_token or (user and password)):
+        raise EnvironmentError(
+            "Authentication credentials not found in environment variables."
+        )
+    return instance_url or os.getenv("SERVICENOW_URL"), api_token, user, password
 
-    This function sets the 'Accept' and 'Content-Type' headers to 'application/json'.
-    If an API token is provided, it sets the 'Authorization' header to 'Bearer {api_token}'.
-    If a username and password are provided, it sets the session authentication to these values.
-    If additional headers are provided in the kwargs, it merges these with the default headers.
+
+def _parse_response(response: Any) -> Dict[str, Any]:
     """
+    Raises for HTTP error statuses and returns the JSON body of a ServiceNow response.
+
+    Works with both requests and httpx responses, which share this interface.
 
-    @wraps(f)
-    def decorated_function(self, *args, **kwargs):
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
+    :param response: The HTTP response.
+    :return: The parsed JSON body.
+    """
+    response.raise_for_status()
+    return response.json()
 
-        if self.api_token:
-            headers["Authorization"] = f"Bearer {self.api_token}"
-        elif self.user and self.password:
-            self.session.auth = (self.user, self.password)
 
-        if "headers" in kwargs:
-            headers = {**headers, **kwargs["headers"]}
+def _log_created(record_type: str, response: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Logs the number of a record created by a POST request.
 
-        kwargs["headers"] = headers
+    :param record_type: Kind of record created, e.g. "Incident".
+    :param response: Parsed response of the POST request.
+    :return: The response, unchanged.
+    """
+    if response:
+        number = response.get("result", {}).get("number", "")
+        logger.info(f"{record_type} created with number: {number}")
+    return response
+
+
+@lru_cache(maxsize=16)
+def _get_session(
+    instance_url: str,
+    api_token: Optional[str],
+    user: Optional[str],
+    password: Optional[str],
+) -> requests.Session:
+    """
+    Returns the process-wide requests.Session for a ServiceNow instance and credentials.
 
-        return f(self, *args, **kwargs)
+    Extractors built for the same instance and credentials share one session, so its
+    keep-alive connections are reused instead of each instance paying a new TCP and TLS
+    handshake. Transient throttling and gateway errors are retried with backoff.
 
-    return decorated_function
+    :param instance_url: ServiceNow instance URL.
+    :param api_token: ServiceNow API token, if token authentication is used.
+    :param user: ServiceNow username, if basic authentication is used.
+    :param password: ServiceNow password, if basic authentication is used.
+    :return: The cached session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=_POOL_MAXSIZE,
+        max_retries=Retry(
+            total=3, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504]
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    if api_token:
+        session.headers.update({"Authorization": f"Bearer {api_token}"})
+    else:
+        session.auth = (user, password)
+
+    session.headers.update(_JSON_HEADERS)
+    return session
 
 
 class ServiceNowDataExtractor:
@@ -48,45 +127,43 @@ class ServiceNowDataExtractor:
     Class for extracting data from the ServiceNow API.
     """
 
-    def __init__(self, instance_url: Optional[str] = None):
+    def __init__(
+        self, instance_url: Optional[str] = None, validate_connection: bool = True
+    ):
         """
         Initializes the ServiceNowDataExtractor with a ServiceNow instance URL.
 
         If an instance URL is not provided, the method uses the URL from the environment variable.
 
+        :param instance_url: ServiceNow instance URL.
+        :param validate_connection: Send a test request to the instance on creation. Set to False
+                                    when extractors are created per task and the extra round trip matters.
+
         Raises:
             EnvironmentError: If the ServiceNow username or password is not found in environment variables.
         """
-        load_dotenv()
-        self.user = os.getenv("SERVICENOW_USER")
-        self.password = os.getenv("SERVICENOW_PASSWORD")
-        self.api_token = os.getenv("SERVICENOW_API_TOKEN")
-
-        if not instance_url:
-            self.instance_url = os.getenv("SERVICENOW_URL")
-        else:
-            self.instance_url = instance_url
-
-        if not (self.api_token or (self.user and self.password)):
-            raise EnvironmentError(
-                "Authentication credentials not found in environment variables."
-            )
+        (
+            self.instance_url,
+            self.api_token,
+            self.user,
+            self.password,
+        ) = _load_credentials(instance_url)
 
         self.base_url = f"{self.instance_url}/api/now/"
-        self.session = requests.Session()
-
-        if self.api_token:
-            self.session.headers.update({"Authorization": f"Bearer {self.api_token}"})
-        else:
-            self.session.auth = (self.user, self.password)
-
-        self.session.headers.update(
-            {"Content-Type": "application/json", "Accept": "application/json"}
+        self.session = _get_session(
+            self.instance_url, self.api_token, self.user, self.password
         )
 
-        # Test connection
+        if not validate_connection:
+            return
+
+        # Test connection and credentials with a single-row, single-field query
         try:
-            response = self.session.get(f"{self.base_url}table/incident")
+            response = self.session.get(
+                f"{self.base_url}table/sys_user",
+                params={"sysparm_limit": 1, "sysparm_fields": "sys_id"},
+                timeout=(3.05, 5),
+            )
             response.raise_for_status()
             logger.info(
                 f"Successfully connected to ServiceNow instance: {self.instance_url}"
@@ -95,7 +172,6 @@ class ServiceNowDataExtractor:
             logger.error(f"Error initializing ServiceNowDataExtractor: {e}")
             raise
 
-    @headers_replace
     def __http_request(
         self,
         method: str,
@@ -106,13 +182,16 @@ class ServiceNowDataExtractor:
     ):
         try:
             url = f"{self.base_url}{path}"
-            prepared_request = self.session.prepare_request(
-                requests.Request(method, url, headers=headers, json=data, params=params)
+            logger.info(f"Sending {method} request to {url}")
+            response = self.session.request(
+                method,
+                url,
+                headers=headers,
+                json=data,
+                params=params,
+                timeout=_REQUEST_TIMEOUT,
             )
-            logger.info(f"Sending {method} request to {prepared_request.url}")
-            response = self.session.send(prepared_request)
-            response.raise_for_status()
-            return response.json()
+            return _parse_response(response)
         except requests.exceptions.RequestException as e:
             logger.error(f"HTTP request error: {e}")
             return {}
@@ -129,6 +208,53 @@ class ServiceNowDataExtractor:
         """
         return self.__http_request("GET", f"table/{table}", params=query_params)
 
+    def get_records_bulk(
+        self,
+        table: str,
+        numbers: List[str],
+        fields: Optional[List[str]] = None,
+        page_size: int = 1000,
+    ) -> Dict[str, Any]:
+        """
+        Retrieves several records by number from a table with as few requests as possible.
+
+        The numbers are sent as a single `numberIN` query per batch of ids, and each result set
+        is paged with `sysparm_limit`/`sysparm_offset`, instead of one request per record.
+
+        :param table: Name of the table to retrieve records from.
+        :param numbers: Record numbers to retrieve, e.g. incident numbers.
+        :param fields: Optional list of fields to return. If not provided, all fields are returned.
+        :param page_size: Maximum number of records returned per request.
+        :return: A dictionary with the retrieved records under "result", in the same shape as a single-record query.
+        :raises RuntimeError: If any page request fails, instead of returning partial results.
+        """
+        records: List[Dict[str, Any]] = []
+        for start in range(0, len(numbers), _BULK_QUERY_SIZE):
+            batch = numbers[start : start + _BULK_QUERY_SIZE]
+            params = {
+                # A stable order keeps offset paging from skipping or repeating records
+                "sysparm_query": "numberIN" + ",".join(batch) + "^ORDERBYsys_id",
+                "sysparm_limit": page_size,
+            }
+            if fields:
+                params["sysparm_fields"] = ",".join(fields)
+
+            offset = 0
+            while True:
+                params["sysparm_offset"] = offset
+                response = self.__http_request("GET", f"table/{table}", params=params)
+                if "result" not in response:
+                    raise RuntimeError(
+                        f"Failed to retrieve records from table {table} at offset {offset}; "
+                        f"{len(records)} records were retrieved before the failure."
+                    )
+                page = response["result"]
+                records.extend(page)
+                if len(page) < page_size:
+                    break
+                offset += page_size
+        return {"result": records}
+
     def get_incident(self, incident_id: str) -> Dict[str, Any]:
         """
         Retrieves a specific incident by its ID from the ServiceNow instance.
@@ -138,6 +264,19 @@ class ServiceNowDataExtractor:
         """
         return self.get_records_from_table("incident", {"number": incident_id})
 
+    def get_incidents(
+        self, incident_ids: List[str], fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieves several incidents by ID from the ServiceNow instance in bulk.
+
+        :param incident_ids: IDs of the incidents to retrieve.
+        :param fields: Optional list of fields to return.
+        :return: A dictionary containing the incident records under "result".
+        :raises RuntimeError: If any page request fails.
+        """
+        return self.get_records_bulk("incident", incident_ids, fields=fields)
+
     def update_incident(
         self, incident_id: str, update_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -159,11 +298,48 @@ class ServiceNowDataExtractor:
         :param incident_data: Dictionary of data to create the incident with.
         :return: A dictionary containing the created incident record, or an empty dictionary if the POST request fails.
         """
-        response = self.__http_request("POST", "table/incident", data=incident_data)
-        if response:
-            incident_number = response.get("result", {}).get("number", "")
-            logger.info(f"Incident created with number: {incident_number}")
-        return response
+        return _log_created(
+            "Incident",
+            self.__http_request("POST", "table/incident", data=incident_data),
+        )
+
+    def create_incidents_bulk(
+        self, incidents_data: List[Dict[str, Any]], max_workers: int = _BULK_MAX_WORKERS
+    ) -> List[Dict[str, Any]]:
+        """
+        Creates several incidents concurrently over the shared session.
+
+        :param incidents_data: List of dictionaries of data to create each incident with.
+        :param max_workers: Maximum number of requests in flight. Defaults to 16.
+        :return: List of created incident records in the same order as `incidents_data`;
+                 empty dictionaries for requests that failed.
+        """
+        if not incidents_data:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(incidents_data))
+        ) as executor:
+            return list(executor.map(self.create_incident, incidents_data))
+
+    def update_incidents_bulk(
+        self,
+        updates: Dict[str, Dict[str, Any]],
+        max_workers: int = _BULK_MAX_WORKERS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Updates several incidents concurrently over the shared session.
+
+        :param updates: Dictionary mapping each incident ID to the data to update it with.
+        :param max_workers: Maximum number of requests in flight. Defaults to 16.
+        :return: List of updated incident records in the iteration order of `updates`;
+                 empty dictionaries for requests that failed.
+        """
+        if not updates:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(updates))) as executor:
+            return list(
+                executor.map(self.update_incident, updates.keys(), updates.values())
+            )
 
     def get_request(self, request_id: str) -> Dict[str, Any]:
         """
@@ -174,6 +350,19 @@ class ServiceNowDataExtractor:
         """
         return self.get_records_from_table("request", {"number": request_id})
 
+    def get_requests(
+        self, request_ids: List[str], fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieves several requests by ID from the ServiceNow instance in bulk.
+
+        :param request_ids: IDs of the requests to retrieve.
+        :param fields: Optional list of fields to return.
+        :return: A dictionary containing the request records under "result".
+        :raises RuntimeError: If any page request fails.
+        """
+        return self.get_records_bulk("request", request_ids, fields=fields)
+
     def update_request(
         self, request_id: str, update_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -195,11 +384,9 @@ class ServiceNowDataExtractor:
         :param request_data: Dictionary of data to create the request with.
         :return: A dictionary containing the created request record, or an empty dictionary if the POST request fails.
         """
-        response = self.__http_request("POST", "table/request", data=request_data)
-        if response:
-            request_number = response.get("result", {}).get("number", "")
-            logger.info(f"Request created with number: {request_number}")
-        return response
+        return _log_created(
+            "Request", self.__http_request("POST", "table/request", data=request_data)
+        )
 
     def extract_metadata(self, file_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -226,3 +413,133 @@ class ServiceNowDataExtractor:
         :return: Bytes content of the file or None if there's an error.
         """
         pass
+
+
+class AsyncServiceNowDataExtractor:
+    """
+    Async client for the ServiceNow API, built on httpx, which must be installed to use it.
+
+    When the optional `h2` package is installed the client negotiates HTTP/2, so many
+    concurrent requests are multiplexed over a single TLS connection. Use it as an
+    async context manager, or call `aclose` when done.
+    """
+
+    def __init__(self, instance_url: Optional[str] = None):
+        """
+        Initializes the AsyncServiceNowDataExtractor with a ServiceNow instance URL.
+
+        If an instance URL is not provided, the method uses the URL from the environment variable.
+
+        :param instance_url: ServiceNow instance URL.
+
+        Raises:
+            EnvironmentError: If the ServiceNow credentials are not found in environment variables.
+        """
+        # httpx is only needed by the async client, so the sync extractor does not depend on it
+        import httpx
+
+        self.instance_url, api_token, user, password = _load_credentials(instance_url)
+
+        headers = dict(_JSON_HEADERS)
+        auth = None
+        if api_token:
+            headers["Authorization"] = f"Bearer {api_token}"
+        else:
+            auth = (user, password)
+
+        self.base_url = f"{self.instance_url}/api/now/"
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            auth=auth,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        )
+
+    async def __aenter__(self) -> "AsyncServiceNowDataExtractor":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Closes the underlying HTTP client and its connections.
+        """
+        await self._client.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[dict] = None,
+        params: Optional[dict] = None,
+    ) -> Dict[str, Any]:
+        import httpx
+
+        try:
+            logger.info(f"Sending {method} request to {self.base_url}{path}")
+            response = await self._client.request(
+                method, path, json=data, params=params
+            )
+            return _parse_response(response)
+        except httpx.HTTPError as e:
+            logger.error(f"HTTP request error: {e}")
+            return {}
+
+    async def get_records_from_table(
+        self, table: str, query_params: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Async counterpart of `ServiceNowDataExtractor.get_records_from_table`.
+        """
+        return await self._request("GET", f"table/{table}", params=query_params)
+
+    async def get_incident(self, incident_id: str) -> Dict[str, Any]:
+        """
+        Async counterpart of `ServiceNowDataExtractor.get_incident`.
+        """
+        return await self.get_records_from_table("incident", {"number": incident_id})
+
+    async def update_incident(
+        self, incident_id: str, update_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Async counterpart of `ServiceNowDataExtractor.update_incident`.
+        """
+        return await self._request(
+            "PUT", f"table/incident/{incident_id}", data=update_data
+        )
+
+    async def create_incident(self, incident_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async counterpart of `ServiceNowDataExtractor.create_incident`.
+        """
+        return _log_created(
+            "Incident",
+            await self._request("POST", "table/incident", data=incident_data),
+        )
+
+    async def get_request(self, request_id: str) -> Dict[str, Any]:
+        """
+        Async counterpart of `ServiceNowDataExtractor.get_request`.
+        """
+        return await self.get_records_from_table("request", {"number": request_id})
+
+    async def update_request(
+        self, request_id: str, update_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Async counterpart of `ServiceNowDataExtractor.update_request`.
+        """
+        return await self._request(
+            "PUT", f"table/request/{request_id}", data=update_data
+        )
+
+    async def create_request(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async counterpart of `ServiceNowDataExtractor.create_request`.
+        """
+        return _log_created(
+            "Request", await self._request("POST", "table/request", data=request_data)
+        )
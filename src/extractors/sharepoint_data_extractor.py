@@ -5,9 +5,9 @@ from typing import Any, Dict, List, Optional, Union
 
 import msal
 import requests
-from dotenv import load_dotenv
 
 from src.extractors.base import DataExtractor
+from src.utils import load_env_once
 
 # load logging
 from utils.ml_logging import get_logger
@@ -47,14 +47,13 @@ class SharePointDataExtractor(DataExtractor):
         self.scope = ["https://graph.microsoft.com/.default"]
         self.access_token = None
 
-    @lru_cache(maxsize=30)
     def load_environment_variables_from_env_file(self):
         """
         Loads required environment variables for the application from a .env file.
 
         This method should be called explicitly if environment variables are to be loaded from a .env file.
         """
-        load_dotenv()
+        load_env_once()
 
         self.tenant_id = os.getenv("TENANT_ID")
         self.client_id = os.getenv("CLIENT_ID")
@@ -1,4 +1,5 @@
-import io
+import mmap
+import os
 
 from utils.ml_logging import get_logger
 
@@ -26,8 +27,7 @@ class TextFileHelper:
         :return: Extracted text from the text file as a string, or an empty string if extraction fails.
         """
         try:
-            with io.BytesIO(txt_bytes) as txt_stream:
-                return self._extract_text_from_txt(txt_stream)
+            return self._decode_text(txt_bytes)
         except Exception as e:
             logger.error(f"An unexpected error occurred during text extraction: {e}")
             return ""
@@ -40,23 +40,31 @@ class TextFileHelper:
         :return: Extracted text from the text file as a string, or None if extraction fails.
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                return self._extract_text_from_txt(file)
+            with open(file_path, "rb") as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    return ""
+                # Decode straight from the page cache in a single pass, instead of
+                # reading through a text-mode buffer into an intermediate string
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return self._decode_text(mapped)
         except Exception as e:
             logger.error(
                 f"An unexpected error occurred when opening the text file: {e}"
             )
             return ""
 
-    def _extract_text_from_txt(self, file_stream) -> str:
+    def _decode_text(self, buffer) -> str:
         """
-        Helper method to extract text from a text file stream.
+        Helper method to decode the contents of a text file.
 
-        :param file_stream: File stream of the text file.
-        :return: Extracted text from the text file as a string, or None if extraction fails.
+        :param buffer: Bytes-like object holding the text file data, e.g. bytes or an mmap.
+        :return: Extracted text from the text file as a string, or an empty string if decoding fails.
         """
         try:
-            text = file_stream.read()
+            text = str(buffer, "utf-8")
+            if "\r" in text:
+                # Match the universal-newline translation of a text-mode read
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
             logger.info("Text extraction from text file was successful.")
             return text
         except Exception as e:
@@ -1,3 +1,7 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
 def get_container_and_blob_name_from_url(blob_url: str) -> tuple:
     """
     Retrieves the container name and the blob name from a blob URL.
@@ -5,6 +9,9 @@ def get_container_and_blob_name_from_url(blob_url: str) -> tuple:
     The container name is always the part of the URL before the last '/'.
     The blob name is always the part of the URL after the last '/'.
 
+    Results are memoized per URL, since the same blob is usually parsed by several
+    pipeline stages. Raise maxsize if the working set of URLs is larger.
+
     :param blob_url: The blob URL.
     :return: A tuple containing the container name and the blob name.
     """
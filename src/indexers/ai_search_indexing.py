@@ -1,28 +1,87 @@
 """This module contains the AzureAIIndexer class, which handles indexing vectorized content from various sources
 and formats using Azure AI services.
 """
+import asyncio
+import json
 import os
-from functools import lru_cache
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from functools import cached_property
+from hashlib import blake2b
 from typing import List, Literal, Optional, Union
 
 import nest_asyncio
-from dotenv import load_dotenv
+from azure.core.exceptions import HttpResponseError
+from azure.search.documents.models import VectorizedQuery
 from langchain.docstore.document import Document
 from langchain.document_loaders import WebBaseLoader
-from langchain.embeddings import AzureOpenAIEmbeddings
+from langchain.embeddings import AzureOpenAIEmbeddings, CacheBackedEmbeddings
+from langchain.storage import LocalFileStore
 from langchain.text_splitter import CharacterTextSplitter
 from langchain.vectorstores.azuresearch import AzureSearch
+from langchain_community.vectorstores.azuresearch import (
+    FIELDS_CONTENT,
+    FIELDS_CONTENT_VECTOR,
+    FIELDS_ID,
+    FIELDS_METADATA,
+)
 
 from src.chunkers.by_character import CharacterDocumentSplitter
 from src.chunkers.by_title import TitleDocumentSplitter
 from src.loaders.from_blob import FilesDocumentLoader
 from src.loaders.from_ocr import OCRFilesDocumentLoader
 from src.loaders.from_sharepoint import SharepointDocumentLoader
+from src.utils import load_env_once
 from utils.ml_logging import get_logger
 
 # Initialize logging
 logger = get_logger()
 
+# Azure AI Search status codes that signal throttling and are worth retrying
+_THROTTLING_STATUS_CODES = {429, 503}
+_RETRY_MAX_DELAY_SECONDS = 30
+
+# Local directory where computed document embeddings are cached between runs
+_EMBEDDING_CACHE_DIR = ".emb_cache"
+
+# Maximum number of AzureSearch clients kept for reuse across indexers
+_VECTOR_STORE_CACHE_SIZE = 16
+
+
+def _document_key(document: Document) -> str:
+    """
+    Returns the index key of a document: its "id" metadata if set, else a hash of its content.
+
+    Content-derived keys make indexing idempotent, as re-indexing the same chunk overwrites
+    the existing entry instead of adding a duplicate.
+
+    :param document: The document to be indexed.
+    :return: The key of the document in the index.
+    """
+    return (
+        document.metadata.get("id")
+        or blake2b(document.page_content.encode("utf-8"), digest_size=16).hexdigest()
+    )
+
+
+def _to_index_document(key: str, document: Document, vector: List[float]) -> dict:
+    """
+    Builds the Azure AI Search document for a chunk, in the layout used by AzureSearch.add_texts.
+
+    :param key: Index key of the chunk.
+    :param document: The chunk to be indexed.
+    :param vector: Embedding of the chunk.
+    :return: The document to upload.
+    """
+    return {
+        FIELDS_ID: key,
+        FIELDS_CONTENT: document.page_content,
+        FIELDS_CONTENT_VECTOR: [float(value) for value in vector],
+        FIELDS_METADATA: json.dumps(document.metadata),
+    }
+
 
 class AzureAIndexer:
     """
@@ -32,6 +91,11 @@ class AzureAIndexer:
     load them from a .env file. Additionally, it can load an index from Azure AI Search.
     """
 
+    # AzureSearch clients keyed by (search endpoint, admin key, index name, embeddings endpoint,
+    # deployment, API version), least recently used first
+    _vector_store_cache: "OrderedDict[tuple, AzureSearch]" = OrderedDict()
+    _vector_store_cache_lock = threading.Lock()
+
     def __init__(
         self,
         index_name: Optional[str] = None,
@@ -74,20 +138,35 @@ class AzureAIndexer:
         if index_name:
             _ = self.load_azureai_index()
 
-        self.files_loader_client = FilesDocumentLoader(container_name=None)
-        self.sharepoint_loader_client = SharepointDocumentLoader()
-        self.character_splitter = CharacterDocumentSplitter()
-        self.title_splitter = TitleDocumentSplitter()
-        self.ocr_loader_client = OCRFilesDocumentLoader()
+    # Loader and splitter clients are built on first use, so callers only pay for the
+    # Azure clients and credentials of the code paths they actually take
+    @cached_property
+    def files_loader_client(self) -> FilesDocumentLoader:
+        return FilesDocumentLoader(container_name=None)
+
+    @cached_property
+    def sharepoint_loader_client(self) -> SharepointDocumentLoader:
+        return SharepointDocumentLoader()
+
+    @cached_property
+    def character_splitter(self) -> CharacterDocumentSplitter:
+        return CharacterDocumentSplitter()
+
+    @cached_property
+    def title_splitter(self) -> TitleDocumentSplitter:
+        return TitleDocumentSplitter()
+
+    @cached_property
+    def ocr_loader_client(self) -> OCRFilesDocumentLoader:
+        return OCRFilesDocumentLoader()
 
-    @lru_cache(maxsize=30)
     def load_environment_variables_from_env_file(self):
         """
         Loads required environment variables for the application from a .env file.
 
         This method should be called explicitly if environment variables are to be loaded from a .env file.
         """
-        load_dotenv()
+        load_env_once()
 
         self.openai_api_key = os.getenv("AZURE_AOAI_API_KEY")
         self.openai_endpoint = os.getenv("AZURE_AOAI_API_ENDPOINT")
@@ -147,17 +226,24 @@ class AzureAIndexer:
         resource_endpoint: Optional[str] = None,
         openai_api_version: Optional[str] = None,
         chunk_size: int = 1000,
-    ) -> AzureOpenAIEmbeddings:
+        cache_dir: Optional[str] = _EMBEDDING_CACHE_DIR,
+    ) -> Union[AzureOpenAIEmbeddings, CacheBackedEmbeddings]:
         """
         Loads and returns an AzureOpenAIEmbeddings object with the specified configuration.
 
+        Unless `cache_dir` is None, the embeddings are wrapped in a CacheBackedEmbeddings backed by
+        a local file store, so chunks that were already embedded are not sent to Azure OpenAI again.
+        The cache namespace includes the endpoint, deployment and API version, so changing any
+        of them starts a fresh cache.
+
         :param azure_deployment: The deployment ID for the OpenAI model.
         :param model_name: The name of the OpenAI model to use.
         :param api_key: The API key for authentication. Overrides the default if provided.
         :param resource_endpoint: The base URL of the Azure OpenAI resource endpoint. Overrides the default if provided.
         :param openai_api_version: The version of the OpenAI API to be used. Overrides the default if provided.
-        :param chunk_size: The size of chunks for processing data. Defaults to 1000.
-        :return: Configured AzureOpenAIEmbeddings object.
+        :param chunk_size: Maximum number of texts sent in one embeddings request by embed_documents. Defaults to 1000.
+        :param cache_dir: Directory of the on-disk embedding cache. Pass None to disable caching.
+        :return: Configured AzureOpenAIEmbeddings object, wrapped in a cache when enabled.
         """
         logger.info(
             f"Loading OpenAIEmbeddings object with model, deployment {azure_deployment}, and chunk size {chunk_size}"
@@ -166,12 +252,28 @@ class AzureAIndexer:
         self._setup_aoai(api_key, resource_endpoint)
 
         try:
+            openai_api_version = openai_api_version or self.azure_openai_api_version
             self.embeddings = AzureOpenAIEmbeddings(
                 api_key=api_key,
                 azure_endpoint=resource_endpoint,
                 azure_deployment=azure_deployment,
-                openai_api_version=openai_api_version or self.azure_openai_api_version,
+                openai_api_version=openai_api_version,
+                chunk_size=chunk_size,
             )
+            embeddings_config = (
+                self.embeddings.azure_endpoint,
+                azure_deployment,
+                openai_api_version,
+            )
+            if cache_dir:
+                # Deployment names are only unique within a resource, so the endpoint is part of the namespace
+                self.embeddings = CacheBackedEmbeddings.from_bytes_store(
+                    self.embeddings,
+                    LocalFileStore(cache_dir),
+                    namespace=f"{self.embeddings.azure_endpoint}:{azure_deployment}:{openai_api_version}:",
+                )
+            # Lets load_azureai_index share AzureSearch clients between indexers with this configuration
+            self._embeddings_config = (self.embeddings, embeddings_config)
             logger.info(
                 """AzureOpenAIEmbeddings object has been created successfully. You can now access the embeddings
                 using the '.embeddings' attribute."""
@@ -185,6 +287,10 @@ class AzureAIndexer:
         """
         Configures an existing AzureSearch instance with the specified index name.
 
+        AzureSearch clients are shared across indexers with the same search endpoint, key, index
+        and embedding deployment, so reloading an index reuses the existing client and its
+        connection pool. Up to 16 clients are kept, least recently used first out.
+
         :return: Configured AzureSearch object.
         :raises ValueError: If the AzureSearch instance or embeddings are not configured.
         """
@@ -216,18 +322,50 @@ class AzureAIndexer:
                 "OpenAIEmbeddings object has not been configured. Please call load_embedding_model() first."
             )
 
-        self.vector_store = AzureSearch(
-            azure_search_endpoint=self.azure_ai_search_service_endpoint,
-            azure_search_key=self.azure_search_admin_key,
-            index_name=self.index_name,
-            embedding_function=self.embeddings.embed_query,
+        embeddings, embeddings_config = getattr(
+            self, "_embeddings_config", (None, None)
         )
+        if embeddings is not self.embeddings:
+            # Embeddings assigned directly have no known deployment to share a client on
+            self.vector_store = self._build_vector_store()
+        else:
+            cache_key = (
+                self.azure_ai_search_service_endpoint,
+                self.azure_search_admin_key,
+                self.index_name,
+                *embeddings_config,
+            )
+            with self._vector_store_cache_lock:
+                vector_store = self._vector_store_cache.get(cache_key)
+                if vector_store is None:
+                    vector_store = self._build_vector_store()
+                    self._vector_store_cache[cache_key] = vector_store
+                    if len(self._vector_store_cache) > _VECTOR_STORE_CACHE_SIZE:
+                        self._vector_store_cache.popitem(last=False)
+                else:
+                    self._vector_store_cache.move_to_end(cache_key)
+            self.vector_store = vector_store
 
         logger.info(
             f"The Azure AI search index '{self.index_name}' has been loaded correctly."
         )
         return self.vector_store
 
+    def _build_vector_store(self) -> AzureSearch:
+        """
+        Creates an AzureSearch client for the configured index and embeddings.
+
+        :return: The AzureSearch object.
+        """
+        return AzureSearch(
+            azure_search_endpoint=self.azure_ai_search_service_endpoint,
+            azure_search_key=self.azure_search_admin_key,
+            index_name=self.index_name,
+            # AzureSearch calls embedding_function(text), so it needs a plain callable.
+            # Indexing embeds batches with embed_documents itself (see _add_documents_with_retry)
+            embedding_function=self.embeddings.embed_query,
+        )
+
     @staticmethod
     def scrape_web_text_and_split_by_character(
         urls: List[str],
@@ -274,7 +412,7 @@ class AzureAIndexer:
             "by_character_recursive",
             "by_character_brute_force",
             "by_title_brute_force",
-        ] = "recursive",
+        ] = "by_character_recursive",
         use_encoder: bool = True,
         ocr: bool = False,
         chunk_size: int = 512,
@@ -303,8 +441,8 @@ class AzureAIndexer:
         or CharacterTextSplitter based on the splitter_type.
 
         :param file_paths: Path or list of paths of the files to be processed.
-        :param splitter_type: The type of splitter to use. Can be "recursive", "tiktoken", "spacy", or "character".
-                                                    If not found, the character splitter will be selected. Defaults to "recursive".
+        :param splitter_type: The type of splitter to use. Can be "by_title", "by_character_recursive",
+                                                    "by_character_brute_force" or "by_title_brute_force". Defaults to "by_character_recursive".
         :param use_encoder: Boolean flag to choose whether to use an encoder for the splitter. Defaults to True.
         :param ocr: Boolean flag to enable OCR capabilities for extracting text from images or scanned documents. Defaults to False.
         :param chunk_size: The number of characters in each text chunk. Defaults to 512.
@@ -328,10 +466,10 @@ class AzureAIndexer:
             specified with the model_name parameter.
         """
         try:
-            # Define loader clients
+            # Define loader clients, by attribute name so only the chosen one is built
             loader_clients = {
                 "ocr": {
-                    "client": self.ocr_loader_client,
+                    "client": "ocr_loader_client",
                     "params": {
                         "file_paths": file_paths,
                         "output_format": ocr_output_format,
@@ -340,7 +478,7 @@ class AzureAIndexer:
                     },
                 },
                 "files": {
-                    "client": self.files_loader_client,
+                    "client": "files_loader_client",
                     "params": {"file_paths": file_paths, **kwargs},
                 },
             }
@@ -351,7 +489,7 @@ class AzureAIndexer:
 
             # Load documents
             try:
-                documents = loader_client["client"].load_documents(
+                documents = getattr(self, loader_client["client"]).load_documents(
                     **loader_client["params"]
                 )
             except Exception as e:
@@ -360,7 +498,7 @@ class AzureAIndexer:
             # Define splitter methods
             splitter_methods = {
                 "by_title": {
-                    "method": self.title_splitter.split_documents_in_chunks_from_documents,
+                    "splitter": "title_splitter",
                     "params": {
                         "documents": documents,
                         "chunk_size": chunk_size,
@@ -368,7 +506,7 @@ class AzureAIndexer:
                     },
                 },
                 "default": {
-                    "method": self.character_splitter.split_documents_in_chunks_from_documents,
+                    "splitter": "character_splitter",
                     "params": {
                         "documents": documents,
                         "splitter_type": splitter_type,
@@ -403,7 +541,10 @@ class AzureAIndexer:
 
             # Split documents into chunks
             try:
-                chunks = splitter_method["method"](**splitter_method["params"])
+                splitter = getattr(self, splitter_method["splitter"])
+                chunks = splitter.split_documents_in_chunks_from_documents(
+                    **splitter_method["params"]
+                )
             except Exception as e:
                 raise Exception(
                     f"An error occurred during splitting documents: {str(e)}"
@@ -418,7 +559,7 @@ class AzureAIndexer:
         site_name: str,
         site_domain: str,
         file_names: Union[str, List[str]],
-        splitter_type: str = "recursive",
+        splitter_type: str = "by_character_recursive",
         use_encoder: bool = True,
         chunk_size: int = 512,
         chunk_overlap: int = 128,
@@ -436,8 +577,8 @@ class AzureAIndexer:
         :param file_names: Name or list of names of the files to be processed.
         :param site_name: Name of the SharePoint site where the files are located.
         :param site_domain: Domain of the SharePoint site where the files are located.
-        :param splitter_type: The type of splitter to use. Can be "recursive", "tiktoken", "spacy", or "character".
-                            If not found, the character splitter will be selected. Defaults to "recursive".
+        :param splitter_type: The type of splitter to use. Can be "by_title", "by_character_recursive",
+                            "by_character_brute_force" or "by_title_brute_force". Defaults to "by_character_recursive".
         :param use_encoder: Boolean flag to choose whether to use an encoder for the splitter. Defaults to True.
         :param chunk_size: The number of characters in each text chunk. Defaults to 512.
         :param chunk_overlap: The number of characters to overlap between chunks. Defaults to 128.
@@ -477,15 +618,137 @@ class AzureAIndexer:
             logger.error(f"Error in splitting documents into chunks: {e}")
             raise
 
-    def index_text_embeddings(self, text_list: List[str]) -> bool:
+    def _drop_indexed_near_duplicates(
+        self,
+        keys: List[str],
+        batch: List[Document],
+        vectors: List[List[float]],
+        dedupe_threshold: float,
+    ) -> List[tuple]:
+        """
+        Drops documents whose nearest neighbour in the index is at least `dedupe_threshold` cosine-similar.
+
+        :param keys: Index keys of the documents.
+        :param batch: Documents to be indexed.
+        :param vectors: Embeddings of the documents.
+        :param dedupe_threshold: Cosine similarity at or above which a document counts as already indexed.
+        :return: (key, document, vector) tuples of the documents that have no near duplicate in the index.
+        """
+        # Azure AI Search reports cosine matches as 1 / (1 + (1 - similarity))
+        min_score = 1 / (2 - dedupe_threshold)
+        kept = []
+        for key, doc, vector in zip(keys, batch, vectors):
+            results = self.vector_store.client.search(
+                search_text=None,
+                vector_queries=[
+                    VectorizedQuery(
+                        vector=vector,
+                        k_nearest_neighbors=1,
+                        fields=FIELDS_CONTENT_VECTOR,
+                    )
+                ],
+                select=[FIELDS_ID],
+                top=1,
+            )
+            nearest = next(iter(results), None)
+            if nearest is None or nearest["@search.score"] < min_score:
+                kept.append((key, doc, vector))
+        if len(kept) < len(batch):
+            logger.info(
+                f"Skipped {len(batch) - len(kept)} chunks already present in the index."
+            )
+        return kept
+
+    def _add_documents_with_retry(
+        self,
+        batch: List[Document],
+        max_retries: int,
+        dedupe_threshold: Optional[float] = None,
+    ) -> None:
+        """
+        Embeds one batch of documents and uploads it to the index, backing off while the service throttles.
+
+        The documents are written in the same layout AzureSearch.add_texts uses (id, content,
+        content vector and JSON metadata), so they remain searchable through the vector store.
+
+        :param batch: Documents to embed and index.
+        :param max_retries: Maximum number of attempts for the batch.
+        :param dedupe_threshold: If set, documents whose nearest indexed neighbour is at least this
+            cosine-similar are skipped.
+        :raises RuntimeError: If the service rejects any document of the batch.
+        :raises HttpResponseError: If the batch still fails after `max_retries` attempts,
+            or fails with a status that is not retried.
+        """
+        # Repeated chunks map to the same key; send each key once per request
+        keyed = {_document_key(doc): doc for doc in batch}
+        keys, documents = list(keyed), list(keyed.values())
+        # Embedding the whole batch with embed_documents batches the Azure OpenAI requests
+        # and goes through the embedding cache, which embed_query does not
+        vectors = self.embeddings.embed_documents(
+            [doc.page_content for doc in documents]
+        )
+        entries = list(zip(keys, documents, vectors))
+        if dedupe_threshold is not None:
+            entries = self._drop_indexed_near_duplicates(
+                keys, documents, vectors, dedupe_threshold
+            )
+            if not entries:
+                return
+        index_documents = [
+            _to_index_document(key, doc, vector) for key, doc, vector in entries
+        ]
+        for attempt in range(1, max_retries + 1):
+            try:
+                started = time.perf_counter()
+                results = self.vector_store.client.upload_documents(
+                    documents=index_documents
+                )
+                failed = [result.key for result in results if not result.succeeded]
+                if failed:
+                    raise RuntimeError(
+                        f"Failed to index {len(failed)} chunks with keys: {', '.join(failed)}"
+                    )
+                logger.info(
+                    f"Indexed batch of {len(index_documents)} chunks in {time.perf_counter() - started:.2f}s."
+                )
+                return
+            except HttpResponseError as e:
+                if (
+                    e.status_code not in _THROTTLING_STATUS_CODES
+                    or attempt == max_retries
+                ):
+                    raise
+                delay = min(_RETRY_MAX_DELAY_SECONDS, 2 ** (attempt - 1))
+                logger.warning(
+                    f"Indexing throttled with status {e.status_code}; retrying batch in {delay}s "
+                    f"(attempt {attempt} of {max_retries})."
+                )
+                time.sleep(delay)
+
+    def index_text_embeddings(
+        self,
+        text_list: List[Document],
+        batch_size: int = 1000,
+        max_concurrency: int = 4,
+        max_retries: int = 6,
+        dedupe_threshold: Optional[float] = None,
+    ) -> bool:
         """
         Generates embeddings for the given texts and indexes them in the configured vector store.
 
         This method first verifies if the vector store (like Azure AI Search) is configured.
-        If configured, it proceeds to add the provided texts to the vector store for indexing.
+        If configured, it splits the documents into batches that are embedded and indexed
+        concurrently. Batches rejected with a throttling status (429/503) are retried with
+        exponential backoff.
 
         Args:
-            text_list (List[str]): A list of text strings for which embeddings are to be generated and indexed.
+            text_list (List[Document]): The documents for which embeddings are to be generated and indexed.
+            batch_size (int): Number of documents sent per indexing request. Defaults to 1000.
+            max_concurrency (int): Maximum number of batches indexed at the same time. Defaults to 4.
+            max_retries (int): Maximum number of attempts per batch. Defaults to 6.
+            dedupe_threshold (float, optional): If set (e.g. 0.98), chunks whose nearest neighbour
+                already in the index has at least this cosine similarity are not indexed again.
+                Costs one vector query per chunk. Defaults to None.
 
         Returns:
             bool: True if the operation was successful, False otherwise.
@@ -498,7 +761,24 @@ class AzureAIndexer:
             logger.info(
                 f"Embedding and indexing initiated for {len(text_list)} text chunks."
             )
-            self.vector_store.add_documents(documents=text_list)
+            batches = [
+                text_list[start : start + batch_size]
+                for start in range(0, len(text_list), batch_size)
+            ]
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(max_concurrency, len(batches)))
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self._add_documents_with_retry,
+                        batch,
+                        max_retries,
+                        dedupe_threshold,
+                    )
+                    for batch in batches
+                ]
+                for future in as_completed(futures):
+                    future.result()
             logger.info(
                 f"Embedding and indexing completed for {len(text_list)} text chunks."
             )
@@ -508,3 +788,141 @@ class AzureAIndexer:
                 f"Unexpected error occurred during embedding and indexing: {e}"
             )
             return False
+
+    async def aindex_text_embeddings(
+        self,
+        text_list: List[Document],
+        batch_size: int = 1000,
+        max_concurrency: int = 4,
+        max_retries: int = 6,
+    ) -> bool:
+        """
+        Asynchronous counterpart of index_text_embeddings for callers running an event loop.
+
+        Batches are indexed concurrently, so the embedding requests of one batch overlap with the
+        upload of another. At most `max_concurrency` batches are in flight; throttled batches are
+        retried with exponential backoff.
+
+        Args:
+            text_list (List[Document]): The documents for which embeddings are to be generated and indexed.
+            batch_size (int): Number of documents sent per indexing request. Defaults to 1000.
+            max_concurrency (int): Maximum number of batches indexed at the same time. Defaults to 4.
+            max_retries (int): Maximum number of attempts per batch. Defaults to 6.
+
+        Returns:
+            bool: True if the operation was successful, False otherwise.
+        """
+        if not getattr(self, "vector_store", None):
+            logger.warning("Vector store client is not configured.")
+            return False
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _index(batch: List[Document]) -> None:
+            async with semaphore:
+                await asyncio.to_thread(
+                    self._add_documents_with_retry, batch, max_retries
+                )
+
+        logger.info(
+            f"Embedding and indexing initiated for {len(text_list)} text chunks."
+        )
+        results = await asyncio.gather(
+            *(
+                _index(text_list[start : start + batch_size])
+                for start in range(0, len(text_list), batch_size)
+            ),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        for e in errors:
+            logger.error(
+                f"Unexpected error occurred during embedding and indexing: {e}"
+            )
+        if errors:
+            return False
+        logger.info(
+            f"Embedding and indexing completed for {len(text_list)} text chunks."
+        )
+        return True
+
+    def split_and_index_files(
+        self,
+        file_paths: Union[str, List[str]],
+        batch_size: int = 1000,
+        max_concurrency: int = 4,
+        max_retries: int = 6,
+        loader_kwargs: Optional[dict] = None,
+        **kwargs,
+    ) -> bool:
+        """
+        Loads, splits and indexes files as a stream, one file at a time.
+
+        Unlike calling load_files_and_split_into_chunks followed by index_text_embeddings, the corpus
+        is never materialized in memory: each file is split as soon as it is loaded, and chunks are
+        indexed in batches while later files are still being read. At most `max_concurrency` batches
+        are in flight, so peak memory is bounded by one file plus the pending batches.
+
+        Args:
+            file_paths (Union[str, List[str]]): Path or list of paths of the files to be processed.
+            batch_size (int): Number of chunks sent per indexing request. Defaults to 1000.
+            max_concurrency (int): Maximum number of batches indexed at the same time. Defaults to 4.
+            max_retries (int): Maximum number of attempts per batch. Defaults to 6.
+            loader_kwargs (dict, optional): Keyword arguments for the document loaders.
+            **kwargs: Keyword arguments for CharacterDocumentSplitter.split_documents_in_chunks_from_documents.
+
+        Returns:
+            bool: True if every batch was indexed, False otherwise.
+        """
+        if not getattr(self, "vector_store", None):
+            logger.warning("Vector store client is not configured.")
+            return False
+
+        success = True
+        pending = set()
+        batch = []
+        total_chunks = 0
+
+        def _collect(done) -> bool:
+            failed = [future.exception() for future in done if future.exception()]
+            for e in failed:
+                logger.error(f"Error occurred during embedding and indexing: {e}")
+            return not failed
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            for documents in self.files_loader_client.iter_documents(
+                file_paths, **(loader_kwargs or {})
+            ):
+                if not documents:
+                    continue
+                batch += (
+                    self.character_splitter.split_documents_in_chunks_from_documents(
+                        documents=documents, **kwargs
+                    )
+                )
+                while len(batch) >= batch_size:
+                    pending.add(
+                        executor.submit(
+                            self._add_documents_with_retry,
+                            batch[:batch_size],
+                            max_retries,
+                        )
+                    )
+                    total_chunks += batch_size
+                    batch = batch[batch_size:]
+                    if len(pending) >= max_concurrency:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        success &= _collect(done)
+
+            if batch:
+                pending.add(
+                    executor.submit(self._add_documents_with_retry, batch, max_retries)
+                )
+                total_chunks += len(batch)
+            done, _ = wait(pending)
+            success &= _collect(done)
+
+        logger.info(
+            f"Streaming embedding and indexing completed for {total_chunks} text chunks."
+        )
+        return success
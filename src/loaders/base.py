@@ -3,7 +3,10 @@ from typing import Any, Dict, List, Optional, Union
 
 from langchain.docstore.document import Document
 
-from src.chunkers.settings import FILE_TYPE_MAPPINGS_LANGCHAIN
+from src.chunkers.settings import (
+    FILE_EXTENSION_MAPPINGS_LANGCHAIN,
+    FILE_TYPE_MAPPINGS_LANGCHAIN,
+)
 
 
 class DocumentLoaders(ABC):
@@ -16,6 +19,7 @@ class DocumentLoaders(ABC):
 
     def __init__(self):
         self.langchain_file_mapping = FILE_TYPE_MAPPINGS_LANGCHAIN
+        self.langchain_extension_mapping = FILE_EXTENSION_MAPPINGS_LANGCHAIN
 
     @abstractmethod
     def load_document(
@@ -1,10 +1,12 @@
 import os
+import pickle
 import tempfile
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 from langchain.docstore.document import Document
-from langchain.document_loaders import DirectoryLoader, JSONLoader
+from langchain.document_loaders import JSONLoader
 
 from src.extractors.blob_data_extractors import AzureBlobDataExtractor
 from src.loaders.base import DocumentLoaders
@@ -14,6 +16,40 @@ from utils.ml_logging import get_logger
 logger = get_logger()
 
 
+def _load_file(
+    loader_cls: type, file_path: str, loader_kwargs: Dict[str, Any]
+) -> List[Document]:
+    """
+    Loads a single file with the given loader class.
+
+    Defined at module level so it can be sent to worker processes.
+
+    :param loader_cls: LangChain loader class used to parse the file.
+    :param file_path: Path of the file to be processed.
+    :param loader_kwargs: Keyword arguments for the loader.
+    :return: Processed documents, or an empty list if the file cannot be loaded.
+    """
+    try:
+        return loader_cls(file_path, **loader_kwargs).load()
+    except Exception as e:
+        logger.error(f"Failed to process file {file_path}: {e}")
+        return []
+
+
+def _is_picklable(value: Any) -> bool:
+    """
+    Checks whether a value can be sent to a worker process.
+
+    :param value: The value to check, e.g. the keyword arguments of a loader.
+    :return: True if the value can be pickled.
+    """
+    try:
+        pickle.dumps(value)
+        return True
+    except Exception:
+        return False
+
+
 class FilesDocumentLoader(DocumentLoaders):
     """
     This class uses a mapping of file types to specific loader classes, which are used to load
@@ -74,22 +110,21 @@ class FilesDocumentLoader(DocumentLoaders):
             file_path = file_url
             logger.info(f"Reading {file_extension} file from {file_url}.")
 
-        for pattern, loader_class in self.langchain_file_mapping.items():
-            if pattern.match(file_extension):
-                logger.info(f"Loading file with Loader {loader_class.__name__}")
-                docs = loader_class(file_path, **kwargs).load()
-
-                # Update or add metadata for each document
-                for doc in docs:
-                    if not doc.metadata:
-                        doc.metadata = {}
-                    if metadata:
-                        doc.metadata.update(metadata)
-                    if source_url:
-                        doc.metadata["source"] = source_url
-                break
-        else:
+        loader_class = self.langchain_extension_mapping.get(file_extension.lower())
+        if loader_class is None:
             raise ValueError(f"No loader found for file extension {file_extension}")
+
+        logger.info(f"Loading file with Loader {loader_class.__name__}")
+        docs = loader_class(file_path, **kwargs).load()
+
+        # Update or add metadata for each document
+        for doc in docs:
+            if not doc.metadata:
+                doc.metadata = {}
+            if metadata:
+                doc.metadata.update(metadata)
+            if source_url:
+                doc.metadata["source"] = source_url
         return docs
 
     def load_document_from_bytes(
@@ -135,83 +170,264 @@ class FilesDocumentLoader(DocumentLoaders):
 
         return docs
 
+    def load_document_from_blob(
+        self,
+        blob_url: str,
+        file_extension: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Dict[str, Any],
+    ) -> List[Document]:
+        """
+        Streams a blob into a temporary file and processes it based on file extension.
+
+        Unlike downloading the content and calling `load_document_from_bytes`, the blob is
+        written to disk as it arrives and is never held in memory as a whole.
+
+        :param blob_url: URL of the blob to be processed.
+        :param file_extension: Extension of the file to be processed. If not provided, it is inferred from the URL.
+        :param metadata: A dictionary of metadata to add or update for the processed documents.
+        :param kwargs: Optional keyword arguments for the loaders.
+        :return: Processed documents.
+        """
+        temp_path = self._download_blob_to_temp_file(blob_url)
+        return self._load_blob_temp_file(
+            temp_path, blob_url, file_extension, metadata, **kwargs
+        )
+
+    def _download_blob_to_temp_file(self, blob_url: str) -> str:
+        """
+        Streams a blob into a named temporary file, removing the file if the download fails.
+
+        :param blob_url: URL of the blob to be downloaded.
+        :return: Path of the temporary file.
+        """
+        temp_file = tempfile.NamedTemporaryFile(delete=False)
+        try:
+            with temp_file:
+                self.blob_manager.extract_content_to_stream(blob_url, temp_file)
+        except BaseException:
+            # Don't leave a partial download behind, including on interrupts
+            os.remove(temp_file.name)
+            raise
+        return temp_file.name
+
+    def _load_blob_temp_file(
+        self,
+        temp_path: str,
+        blob_url: str,
+        file_extension: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Dict[str, Any],
+    ) -> List[Document]:
+        """
+        Processes a downloaded blob and deletes its temporary file.
+
+        :param temp_path: Path of the temporary file holding the blob.
+        :param blob_url: URL the blob was downloaded from.
+        :param file_extension: Extension of the file to be processed. If not provided, it is inferred from the URL.
+        :param metadata: A dictionary of metadata to add or update for the processed documents.
+        :param kwargs: Optional keyword arguments for the loaders.
+        :return: Processed documents.
+        """
+        try:
+            if not file_extension:
+                _, file_extension = os.path.splitext(blob_url)
+            return self.load_document(
+                file_path=temp_path,
+                file_extension=file_extension,
+                source_url=blob_url,
+                metadata=metadata,
+                **kwargs,
+            )
+        finally:
+            try:
+                os.remove(temp_path)
+                logger.info(f"Deleted temporary file: {temp_path}")
+            except OSError as e:
+                logger.warning(f"Error deleting temporary file: {e}")
+
+    @staticmethod
+    def _is_blob_url(file_path: str) -> bool:
+        """
+        Checks whether a path is an Azure Blob Storage URL.
+
+        :param file_path: Path or URL of the file.
+        :return: True if the path is a blob URL.
+        """
+        return (
+            file_path.startswith(("http", "https"))
+            and "blob.core.windows.net" in file_path
+        )
+
+    def _load_one(self, file_path: str, **kwargs) -> List[Document]:
+        """
+        Loads a single file from the local file system, a URL, or Azure Blob Storage.
+
+        :param file_path: Path or URL of the file to be processed.
+        :param kwargs: Optional keyword arguments for the loaders.
+        :return: Processed documents.
+        """
+        if self._is_blob_url(file_path):
+            metadata = self.blob_manager.extract_metadata(file_path)
+            metadata = self.blob_manager.format_metadata(metadata)
+            return self.load_document_from_blob(file_path, metadata=metadata, **kwargs)
+        if file_path.startswith(("http", "https")):
+            return self.load_document(file_url=file_path, **kwargs)
+        return self.load_document(file_path, **kwargs)
+
     def load_documents(
-        self, file_paths: Optional[Union[str, List[str]]] = None, **kwargs
+        self,
+        file_paths: Optional[Union[str, List[str]]] = None,
+        max_workers: int = 8,
+        **kwargs,
     ) -> Union[Document, List[Document]]:
         """
         Loads files from the local file system, URLs, or SharePoint and processes them based on file extension.
 
+        Blobs are downloaded on a thread pool while files are parsed one at a time in the calling
+        thread, so downloads overlap with parsing. Parsing stays serial because loaders such as
+        PyMuPDF are not thread-safe. Documents are returned in the order of `file_paths`.
+
         :param file_paths: Path or list of paths of the files to be processed.
+        :param max_workers: Maximum number of blobs downloaded at the same time. Defaults to 8.
         :param kwargs: Optional keyword arguments for the loaders.
         :return: Processed documents.
         """
         if not file_paths:
             raise ValueError("'file_paths' must be provided.")
 
+        if isinstance(file_paths, str):
+            file_paths = [file_paths]
+
+        def _download(blob_url: str) -> Tuple[str, Dict[str, Any]]:
+            metadata = self.blob_manager.format_metadata(
+                self.blob_manager.extract_metadata(blob_url)
+            )
+            return self._download_blob_to_temp_file(blob_url), metadata
+
         docs = []
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(file_paths)))
+        ) as executor:
+            downloads = [
+                executor.submit(_download, file_path)
+                if self._is_blob_url(file_path)
+                else None
+                for file_path in file_paths
+            ]
+            try:
+                for index, file_path in enumerate(file_paths):
+                    download, downloads[index] = downloads[index], None
+                    try:
+                        if download is None:
+                            docs += self._load_one(file_path, **kwargs)
+                        else:
+                            temp_path, metadata = download.result()
+                            docs += self._load_blob_temp_file(
+                                temp_path, file_path, metadata=metadata, **kwargs
+                            )
+                    except Exception as e:
+                        logger.error(f"Error loading file {file_path}: {e}")
+            finally:
+                # Remove downloads that were never parsed, e.g. after an interrupt
+                for download in downloads:
+                    if download is None or download.cancel():
+                        continue
+                    try:
+                        os.remove(download.result()[0])
+                    except Exception:
+                        pass
+        return docs
+
+    def iter_documents(
+        self, file_paths: Union[str, List[str]], **kwargs
+    ) -> Iterator[List[Document]]:
+        """
+        Lazily loads files one at a time, yielding the documents of each file as soon as it is parsed.
+
+        Only one file's documents are held in memory at a time, so corpora larger than memory
+        can be processed as a stream.
 
+        :param file_paths: Path or list of paths of the files to be processed.
+        :param kwargs: Optional keyword arguments for the loaders.
+        :return: Iterator over the documents of each file, in the order of `file_paths`.
+            Files that fail to load are logged and skipped.
+        """
         if isinstance(file_paths, str):
             file_paths = [file_paths]
 
         for file_path in file_paths:
             try:
-                if file_path.startswith(("http", "https")):
-                    if "blob.core.windows.net" in file_path:
-                        content_bytes = self.blob_manager.extract_content(file_path)
-                        metadata = self.blob_manager.extract_metadata(file_path)
-                        metadata = self.blob_manager.format_metadata(metadata)
-                        documents = self.load_document_from_bytes(
-                            content_bytes,
-                            source_url=file_path,
-                            metadata=metadata,
-                            **kwargs,
-                        )
-                    else:
-                        documents = self.load_document(file_url=file_path, **kwargs)
-                else:
-                    documents = self.load_document(file_path, **kwargs)
-                docs += documents
+                yield self._load_one(file_path, **kwargs)
             except Exception as e:
                 logger.error(f"Error loading file {file_path}: {e}")
-        return docs
 
     def process_files_from_directory(
-        self, dir: str, **loader_kwargs: Dict[str, Any]
+        self,
+        dir: str,
+        max_workers: Optional[int] = None,
+        **loader_kwargs: Dict[str, Any],
     ) -> List[Document]:
         """
         Loads and processes files from a directory based on their file extension.
 
-        :param temp_dir: Directory containing the files.
-        :param loader_kwargs: Optional keyword arguments for the loaders.
+        Parsing is CPU bound, so files are loaded on a process pool and every core can
+        work on a different file. Files whose loader kwargs cannot be pickled (e.g. a JSONLoader
+        metadata_func lambda) are loaded in this process instead. Documents are returned in
+        directory listing order.
+
+        :param dir: Directory containing the files.
+        :param max_workers: Number of worker processes. Defaults to the number of CPUs.
+        :param loader_kwargs: Optional keyword arguments for the loaders, keyed by glob pattern (e.g. "*.pdf").
         :return: List of processed documents.
         """
-        docs = []
-        for glob_pattern, loader_cls in self.langchain_file_mapping.items():
-            print(f"what is the {glob_pattern}")
-            try:
-                kwargs = loader_kwargs.get(glob_pattern, {})
+        tasks = []
+        with os.scandir(dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.is_file():
+                    continue
+                extension = os.path.splitext(entry.name)[1].lower()
+                loader_cls = self.langchain_extension_mapping.get(extension)
+                if loader_cls is None:
+                    continue
+                kwargs = dict(loader_kwargs.get(f"*{extension}", {}))
                 if (
                     loader_cls == JSONLoader
                     and "jq_schema" not in kwargs
                     and "text_content" not in kwargs
                 ):
                     kwargs.update({"jq_schema": ".", "text_content": False})
-                loader_dir = DirectoryLoader(
-                    dir,
-                    glob=glob_pattern,
-                    loader_cls=loader_cls,
-                    loader_kwargs=kwargs,
-                    show_progress=False,
-                    use_multithreading=True,
-                )
-                documents = loader_dir.load()
-                docs += documents
-                logger.info(
-                    f"Try loaded files from {dir} with glob pattern {glob_pattern}"
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to process files from directory {dir} with glob pattern {glob_pattern}: {e}"
+                tasks.append((loader_cls, entry.path, kwargs))
+
+        if not tasks:
+            return []
+
+        docs = []
+        picklable = {}
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers or os.cpu_count() or 1, len(tasks))
+        ) as executor:
+            futures = []
+            for loader_cls, file_path, kwargs in tasks:
+                extension = os.path.splitext(file_path)[1].lower()
+                if extension not in picklable:
+                    picklable[extension] = _is_picklable((loader_cls, kwargs))
+                    if not picklable[extension]:
+                        logger.warning(
+                            f"Loader or kwargs for *{extension} cannot be pickled; loading these files in-process."
+                        )
+                futures.append(
+                    executor.submit(_load_file, loader_cls, file_path, kwargs)
+                    if picklable[extension]
+                    else None
                 )
-                continue
+            for (loader_cls, file_path, kwargs), future in zip(tasks, futures):
+                if future is None:
+                    docs += _load_file(loader_cls, file_path, kwargs)
+                    continue
+                try:
+                    docs += future.result()
+                except Exception as e:
+                    logger.error(f"Failed to process file {file_path}: {e}")
+        logger.info(f"Loaded {len(docs)} documents from {len(tasks)} files in {dir}")
         return docs
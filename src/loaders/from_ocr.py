@@ -2,10 +2,12 @@
 This module defines the FilesDocumentLoader class which loads and processes documents from paths using OCRDataExtractor.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from langchain.docstore.document import Document
 
+from src.chunkers.settings import PDF_LOADER
 from src.extractors.ocr_data_extractors import OCRDataExtractor
 from src.loaders.base import DocumentLoaders
 from utils.ml_logging import get_logger
@@ -13,6 +15,9 @@ from utils.ml_logging import get_logger
 # Initialize logger
 logger = get_logger()
 
+# Pages whose extracted text is shorter than this are treated as scanned images
+_MIN_CHARS_PER_PAGE = 50
+
 
 class OCRFilesDocumentLoader(DocumentLoaders):
     def __init__(self):
@@ -75,3 +80,149 @@ class OCRFilesDocumentLoader(DocumentLoaders):
                 for file_path in file_paths
             )
         ]
+
+    def load_pdf_with_ocr_fallback(
+        self,
+        file_path: str,
+        output_format: Optional[str] = "markdown",
+        min_chars_per_page: int = _MIN_CHARS_PER_PAGE,
+        **kwargs,
+    ) -> List[Document]:
+        """
+        Loads a PDF with the native text extractor and sends only its low-yield pages to OCR.
+
+        Pages with an embedded text layer are read locally; pages that yield fewer than
+        `min_chars_per_page` characters (typically scanned images) are analyzed by Azure
+        Document Intelligence in a single request restricted to those pages, so only they are billed.
+
+        :param file_path: Local path or HTTP URL of the PDF file.
+        :param output_format: The format of the OCR output.
+        :param min_chars_per_page: Minimum number of characters for a page to skip OCR. Defaults to 50.
+        :param kwargs: Optional keyword arguments for the analyze_document method.
+        :return: One document per text page, followed by one document with the OCR content of the scanned pages.
+        """
+        pages, low_yield = self._load_native_pages(file_path, min_chars_per_page)
+        if not low_yield:
+            return pages
+        ocr_document = self._ocr_pages(file_path, low_yield, output_format, **kwargs)
+        return self._merge_ocr_pages(pages, low_yield, ocr_document)
+
+    def load_pdfs_with_ocr_fallback(
+        self,
+        file_paths: Union[str, List[str]],
+        output_format: Optional[str] = "markdown",
+        min_chars_per_page: int = _MIN_CHARS_PER_PAGE,
+        max_workers: int = 8,
+        **kwargs,
+    ) -> List[Document]:
+        """
+        Loads several PDFs like load_pdf_with_ocr_fallback, overlapping native extraction with OCR.
+
+        The native text extraction runs one file at a time in the calling thread, since PyMuPDF
+        is not thread-safe. The Document Intelligence requests for low-yield pages run on a thread
+        pool, so they proceed while the next files are being read.
+
+        :param file_paths: Local paths or HTTP URLs of the PDF files.
+        :param output_format: The format of the OCR output.
+        :param min_chars_per_page: Minimum number of characters for a page to skip OCR. Defaults to 50.
+        :param max_workers: Maximum number of concurrent Document Intelligence requests. Defaults to 8.
+        :param kwargs: Optional keyword arguments for the analyze_document method.
+        :return: The documents of all files, in the order of `file_paths`.
+        """
+        if isinstance(file_paths, str):
+            file_paths = [file_paths]
+
+        loaded = []
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(file_paths)))
+        ) as executor:
+            for file_path in file_paths:
+                try:
+                    pages, low_yield = self._load_native_pages(
+                        file_path, min_chars_per_page
+                    )
+                except Exception as e:
+                    logger.error(f"Error loading file {file_path}: {e}")
+                    continue
+                ocr_future = (
+                    executor.submit(
+                        self._ocr_pages, file_path, low_yield, output_format, **kwargs
+                    )
+                    if low_yield
+                    else None
+                )
+                loaded.append((file_path, pages, low_yield, ocr_future))
+
+            docs = []
+            for file_path, pages, low_yield, ocr_future in loaded:
+                if ocr_future is None:
+                    docs += pages
+                    continue
+                try:
+                    docs += self._merge_ocr_pages(pages, low_yield, ocr_future.result())
+                except Exception as e:
+                    logger.error(f"Error loading file {file_path}: {e}")
+        return docs
+
+    @staticmethod
+    def _load_native_pages(
+        file_path: str, min_chars_per_page: int
+    ) -> Tuple[List[Document], List[int]]:
+        """
+        Extracts the text layer of a PDF and finds the pages that yield too little text.
+
+        :param file_path: Local path or HTTP URL of the PDF file.
+        :param min_chars_per_page: Minimum number of characters for a page to skip OCR.
+        :return: The page documents and the indexes of the low-yield pages.
+        """
+        pages = PDF_LOADER(file_path).load()
+        low_yield = [
+            index
+            for index, page in enumerate(pages)
+            if len(page.page_content.strip()) < min_chars_per_page
+        ]
+        return pages, low_yield
+
+    def _ocr_pages(
+        self,
+        file_path: str,
+        low_yield: List[int],
+        output_format: Optional[str] = "markdown",
+        **kwargs,
+    ) -> Document:
+        """
+        Analyzes the given pages of a PDF with Azure Document Intelligence in a single request.
+
+        :param file_path: Local path or HTTP URL of the PDF file.
+        :param low_yield: Zero-based indexes of the pages to analyze.
+        :param output_format: The format of the OCR output.
+        :param kwargs: Optional keyword arguments for the analyze_document method.
+        :return: One document with the OCR content of the pages.
+        """
+        page_numbers = ",".join(str(index + 1) for index in low_yield)
+        logger.info(f"Running OCR on pages {page_numbers} of {file_path}")
+        # _analyze keeps no state on the extractor, unlike extract_content, so
+        # concurrent calls from load_pdfs_with_ocr_fallback cannot mix up results
+        result_ocr = self.ocr_data_extractors._analyze(
+            file_path, output_format, page_numbers, **kwargs
+        )
+        metadata = self.ocr_data_extractors.extract_metadata(file_path, result_ocr)
+        metadata["pages"] = page_numbers
+        return Document(page_content=result_ocr.content, metadata=metadata)
+
+    @staticmethod
+    def _merge_ocr_pages(
+        pages: List[Document], low_yield: List[int], ocr_document: Document
+    ) -> List[Document]:
+        """
+        Replaces the low-yield pages of a PDF with the document holding their OCR content.
+
+        :param pages: The page documents from the native extractor.
+        :param low_yield: Zero-based indexes of the pages that were sent to OCR.
+        :param ocr_document: The OCR content of those pages.
+        :return: The text pages, followed by the OCR document.
+        """
+        skipped = set(low_yield)
+        return [page for index, page in enumerate(pages) if index not in skipped] + [
+            ocr_document
+        ]
@@ -122,22 +122,21 @@ class SharepointDocumentLoader(DocumentLoaders):
             file_path = file_url
             logger.info(f"Reading {file_extension} file from {file_url}.")
 
-        for pattern, loader_class in self.langchain_file_mapping.items():
-            if pattern.match(file_extension):
-                logger.info(f"Loading file with Loader {loader_class.__name__}")
-                docs = loader_class(file_path, **kwargs).load()
-
-                # Update or add metadata for each document
-                for doc in docs:
-                    if not doc.metadata:
-                        doc.metadata = {}
-                    if metadata:
-                        doc.metadata.update(metadata)
-                    if source_url:
-                        doc.metadata["source"] = source_url
-                break
-        else:
+        loader_class = self.langchain_extension_mapping.get(file_extension.lower())
+        if loader_class is None:
             raise ValueError(f"No loader found for file extension {file_extension}")
+
+        logger.info(f"Loading file with Loader {loader_class.__name__}")
+        docs = loader_class(file_path, **kwargs).load()
+
+        # Update or add metadata for each document
+        for doc in docs:
+            if not doc.metadata:
+                doc.metadata = {}
+            if metadata:
+                doc.metadata.update(metadata)
+            if source_url:
+                doc.metadata["source"] = source_url
         return docs
 
     def load_document(
@@ -1,7 +1,23 @@
 import re
+from functools import lru_cache
 from typing import Optional, Tuple
 
+from dotenv import load_dotenv
 
+
+@lru_cache(maxsize=1)
+def load_env_once() -> bool:
+    """
+    Loads environment variables from the .env file once per process.
+
+    Subsequent calls return immediately instead of re-reading and re-parsing the file.
+
+    :return: True if a .env file was found and loaded, False otherwise.
+    """
+    return load_dotenv()
+
+
+@lru_cache(maxsize=4096)
 def get_container_and_blob_name_from_url(blob_url: str) -> tuple:
     """
     Retrieves the container name and the blob name from a blob URL.
@@ -9,6 +25,8 @@ def get_container_and_blob_name_from_url(blob_url: str) -> tuple:
     The container name is always the part of the URL before the last '/'.
     The blob name is always the part of the URL after the last '/'.
 
+    Results are memoized per URL, like the copy in src.extractors.utils.
+
     :param blob_url: The blob URL.
     :return: A tuple containing the container name and the blob name.
     """
@@ -9,6 +9,11 @@ from __future__ import annotations
 import pytest
 from _pytest.nodes import Item
 
+from tests.dependency_stubs import install_missing_dependency_stubs
+
+# Lets unit tests import src modules whose SDKs are not installed, see tests/dependency_stubs.py
+install_missing_dependency_stubs()
+
 
 def pytest_collection_modifyitems(items: list[Item]):
     for item in items:
@@ -0,0 +1,147 @@
+"""
+Stand-ins for third-party SDKs that are not installed, so unit tests of the pure-Python helpers in
+`src` can import their modules offline.
+
+Stubs are only installed for top-level packages that cannot be found; when the real SDKs are
+installed they are always used. Every attribute of a stubbed module is an inert placeholder class,
+except for the few names in `_OVERRIDES` whose behaviour the tests rely on.
+"""
+
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import sys
+import types
+from typing import Any, Dict, Optional
+
+# Third-party packages imported by the modules under test
+_STUBBED_PACKAGES = (
+    "azure",
+    "dateutil",
+    "dotenv",
+    "langchain",
+    "langchain_community",
+    "langchain_core",
+    "msal",
+    "nest_asyncio",
+    "numpy",
+    "openai",
+    "pandas",
+    "requests",
+    "tiktoken",
+    "urllib3",
+)
+
+
+class _StubMeta(type):
+    def __getattr__(cls, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Stub()
+
+
+class _Stub(metaclass=_StubMeta):
+    """
+    Inert placeholder: accepts any arguments, and any attribute or call returns another placeholder.
+    """
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Stub()
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return _Stub()
+
+
+class _Document:
+    """
+    Minimal langchain Document: page content plus a metadata dictionary.
+    """
+
+    def __init__(self, page_content: str, metadata: Optional[dict] = None, **kwargs):
+        self.page_content = page_content
+        self.metadata = metadata if metadata is not None else {}
+
+    def __eq__(self, other: Any) -> bool:
+        return (
+            isinstance(other, _Document)
+            and self.page_content == other.page_content
+            and self.metadata == other.metadata
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Document(page_content={self.page_content!r}, metadata={self.metadata!r})"
+        )
+
+
+class _HttpResponseError(Exception):
+    def __init__(
+        self, message: Optional[str] = None, status_code: Optional[int] = None, **kwargs
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+# Attributes whose behaviour the tests rely on, by module
+_OVERRIDES: Dict[str, Dict[str, Any]] = {
+    "langchain.docstore.document": {"Document": _Document},
+    "langchain_core.documents": {"Document": _Document},
+    "langchain_community.vectorstores.azuresearch": {
+        "FIELDS_ID": "id",
+        "FIELDS_CONTENT": "content",
+        "FIELDS_CONTENT_VECTOR": "content_vector",
+        "FIELDS_METADATA": "metadata",
+    },
+    "azure.core.exceptions": {"HttpResponseError": _HttpResponseError},
+}
+
+
+class _StubModule(types.ModuleType):
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        # Exception classes must derive from BaseException to be usable in except clauses
+        base = Exception if name.endswith(("Error", "Exception")) else _Stub
+        value = type(name, (base,), {"__module__": self.__name__})
+        setattr(self, name, value)
+        return value
+
+
+class _StubLoader(importlib.abc.Loader):
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> types.ModuleType:
+        module = _StubModule(spec.name)
+        module.__path__ = []
+        for name, value in _OVERRIDES.get(spec.name, {}).items():
+            setattr(module, name, value)
+        return module
+
+    def exec_module(self, module: types.ModuleType) -> None:
+        pass
+
+
+class _StubFinder(importlib.abc.MetaPathFinder):
+    def __init__(self, packages: tuple):
+        self.packages = packages
+
+    def find_spec(self, fullname: str, path=None, target=None):
+        if fullname.split(".")[0] not in self.packages:
+            return None
+        return importlib.machinery.ModuleSpec(fullname, _StubLoader(), is_package=True)
+
+
+def install_missing_dependency_stubs() -> None:
+    """
+    Installs the stub finder for every package of `_STUBBED_PACKAGES` that is not installed.
+    """
+    missing = tuple(
+        package
+        for package in _STUBBED_PACKAGES
+        if package not in sys.modules and importlib.util.find_spec(package) is None
+    )
+    if missing:
+        sys.meta_path.append(_StubFinder(missing))
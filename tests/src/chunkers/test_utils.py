@@ -0,0 +1,43 @@
+from langchain.docstore.document import Document
+
+from src.chunkers.utils import dedupe_chunks
+
+
+def test_dedupe_chunks_keeps_first_occurrence_in_order():
+    """
+    Test that repeated chunks are dropped and the first occurrence of each is kept, in order.
+    """
+    chunks = [
+        Document(page_content="Header", metadata={"page": 1}),
+        Document(page_content="Body one"),
+        Document(page_content="Header", metadata={"page": 2}),
+        Document(page_content="Body two"),
+    ]
+
+    result = dedupe_chunks(chunks)
+
+    assert [chunk.page_content for chunk in result] == [
+        "Header",
+        "Body one",
+        "Body two",
+    ]
+    assert result[0].metadata == {"page": 1}
+
+
+def test_dedupe_chunks_ignores_case_and_surrounding_whitespace():
+    """
+    Test that chunks differing only by case or surrounding whitespace are treated as duplicates.
+    """
+    chunks = [
+        Document(page_content="Confidential"),
+        Document(page_content="  CONFIDENTIAL\n"),
+    ]
+
+    assert dedupe_chunks(chunks) == [chunks[0]]
+
+
+def test_dedupe_chunks_empty():
+    """
+    Test that an empty list of chunks is returned unchanged.
+    """
+    assert dedupe_chunks([]) == []
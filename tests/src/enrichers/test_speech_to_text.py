@@ -0,0 +1,30 @@
+import pytest
+
+from src.enrichers.speech_to_text import SpeechCoreTranslator
+
+
+def test_parse_blob_url():
+    """
+    Test that the container is the first path segment and the rest is the blob name.
+    """
+    assert SpeechCoreTranslator._parse_blob_url(
+        "https://account.blob.core.windows.net/audio/2024/01/call.wav?sv=token"
+    ) == ("audio", "2024/01/call.wav")
+
+
+@pytest.mark.parametrize(
+    "blob_url",
+    [
+        "https://account.blob.core.windows.net/audio",
+        "https://account.blob.core.windows.net/audio/",
+        "https://account.blob.core.windows.net/",
+    ],
+)
+def test_parse_blob_url_without_blob_name(blob_url):
+    """
+    Test that URLs missing a container or a blob name raise a ValueError naming the URL.
+
+    :param blob_url: The invalid blob URL.
+    """
+    with pytest.raises(ValueError, match="Invalid blob URL"):
+        SpeechCoreTranslator._parse_blob_url(blob_url)
@@ -0,0 +1,108 @@
+import os
+from io import BytesIO
+
+import pytest
+
+from src.extractors.blob_data_extractors import AzureBlobDataExtractor, _BufferWriter
+
+
+@pytest.fixture
+def extractor() -> AzureBlobDataExtractor:
+    """
+    Build an extractor without connecting to Azure Blob Storage.
+
+    :return: An AzureBlobDataExtractor with only the attributes used offline.
+    """
+    extractor = object.__new__(AzureBlobDataExtractor)
+    extractor.container_name = "container"
+    extractor.max_concurrency = 1
+    return extractor
+
+
+def test_buffer_writer_out_of_order_writes():
+    """
+    Test that ranges written out of order, as parallel downloads do, land at their offsets.
+    """
+    buffer = bytearray(10)
+    writer = _BufferWriter(buffer)
+
+    writer.seek(5)
+    assert writer.write(b"world") == 5
+    assert writer.tell() == 10
+    writer.seek(0)
+    writer.write(b"hello")
+
+    assert bytes(buffer) == b"helloworld"
+
+
+def test_buffer_writer_relative_seek():
+    """
+    Test that seeking relative to the current position and to the end is supported.
+    """
+    writer = _BufferWriter(bytearray(8))
+
+    writer.seek(2)
+    assert writer.seek(3, os.SEEK_CUR) == 5
+    assert writer.seek(-1, os.SEEK_END) == 7
+    assert writer.seekable()
+
+
+def test_write_blob_data_to_single_file(extractor, tmp_path):
+    """
+    Test that blobs are written back to back and the index points at each of them.
+
+    :param extractor: Offline AzureBlobDataExtractor.
+    :param tmp_path: pytest's built-in fixture providing a temporary directory.
+    """
+    blobs = [BytesIO(b"first"), BytesIO(b""), BytesIO(b"third blob")]
+    filenames = ["a.txt", "empty.txt", "c.txt"]
+    out_path = tmp_path / "staged.bin"
+
+    index = extractor.write_blob_data_to_single_file(blobs, filenames, str(out_path))
+
+    assert index == [("a.txt", 0, 5), ("empty.txt", 5, 0), ("c.txt", 5, 10)]
+    data = out_path.read_bytes()
+    assert data == b"firstthird blob"
+    for (_, offset, size), blob in zip(index, blobs):
+        assert data[offset : offset + size] == blob.getvalue()
+
+
+def test_download_blobs_to_temp_files_keeps_blob_paths(extractor, monkeypatch):
+    """
+    Test that blobs sharing a name under different prefixes are downloaded to distinct paths,
+    and that names escaping the temporary directory are skipped.
+
+    :param extractor: Offline AzureBlobDataExtractor.
+    :param monkeypatch: pytest's built-in fixture for patching attributes.
+    """
+
+    class FakeDownloader:
+        def __init__(self, data: bytes):
+            self.data = data
+
+        def readinto(self, stream) -> int:
+            return stream.write(self.data)
+
+    class FakeBlobClient:
+        def __init__(self, blob_name: str):
+            self.blob_name = blob_name
+
+        def download_blob(self, **kwargs) -> FakeDownloader:
+            return FakeDownloader(self.blob_name.encode("utf-8"))
+
+    monkeypatch.setattr(
+        extractor,
+        "_get_blob_client",
+        lambda container_name, blob_name: FakeBlobClient(blob_name),
+        raising=False,
+    )
+
+    paths = extractor.download_blobs_to_temp_files(
+        ["2023/report.pdf", "2024/report.pdf", "../escape.pdf"]
+    )
+
+    assert len(paths) == 2
+    assert paths[0] != paths[1]
+    assert paths[0].endswith(os.path.join("2023", "report.pdf"))
+    with open(paths[1], "rb") as file:
+        assert file.read() == b"2024/report.pdf"
@@ -0,0 +1,64 @@
+import io
+import zipfile
+
+import pytest
+
+from src.extractors.docx_data_extractor import DocxHelper
+
+_DOCUMENT_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    "<w:body>"
+    "<w:p><w:r><w:t>Hello </w:t></w:r><w:r><w:t>world</w:t></w:r></w:p>"
+    "<w:p><w:r><w:t>Name</w:t><w:tab/><w:t>Value</w:t></w:r></w:p>"
+    "<w:p><w:r><w:t>Line one</w:t><w:br/><w:t>Line two</w:t></w:r></w:p>"
+    "</w:body>"
+    "</w:document>"
+)
+
+
+@pytest.fixture
+def docx_bytes() -> bytes:
+    """
+    Build a minimal DOCX archive containing only word/document.xml.
+
+    :return: Bytes of the DOCX file.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", _DOCUMENT_XML)
+    return buffer.getvalue()
+
+
+def test_extract_text_from_docx_bytes(docx_bytes):
+    """
+    Test that runs are joined within a paragraph and paragraphs, tabs and breaks are preserved.
+
+    :param docx_bytes: Bytes of the DOCX file.
+    """
+    text = DocxHelper().extract_text_from_docx_bytes(docx_bytes)
+
+    assert text == "Hello world\nName\tValue\nLine one\nLine two"
+
+
+def test_extract_text_from_docx_file(docx_bytes, tmp_path):
+    """
+    Test that extracting from a file gives the same text as extracting from bytes.
+
+    :param docx_bytes: Bytes of the DOCX file.
+    :param tmp_path: pytest's built-in fixture providing a temporary directory.
+    """
+    file_path = tmp_path / "sample.docx"
+    file_path.write_bytes(docx_bytes)
+    helper = DocxHelper()
+
+    assert helper.extract_text_from_docx_file(
+        str(file_path)
+    ) == helper.extract_text_from_docx_bytes(docx_bytes)
+
+
+def test_extract_text_from_invalid_docx_returns_empty_string():
+    """
+    Test that bytes which are not a DOCX archive yield an empty string instead of raising.
+    """
+    assert DocxHelper().extract_text_from_docx_bytes(b"not a docx") == ""
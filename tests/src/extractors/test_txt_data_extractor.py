@@ -0,0 +1,43 @@
+from src.extractors.txt_data_extractor import TextFileHelper
+
+
+def test_extract_text_from_txt_bytes_normalizes_newlines():
+    """
+    Test that Windows and old Mac line endings are translated like a text-mode read.
+    """
+    text = TextFileHelper().extract_text_from_txt_bytes(b"one\r\ntwo\rthree\n")
+
+    assert text == "one\ntwo\nthree\n"
+
+
+def test_extract_text_from_txt_file(tmp_path):
+    """
+    Test that a UTF-8 file is read and decoded through the memory-mapped path.
+
+    :param tmp_path: pytest's built-in fixture providing a temporary directory.
+    """
+    file_path = tmp_path / "sample.txt"
+    file_path.write_bytes("café\r\nnaïve".encode("utf-8"))
+
+    assert TextFileHelper().extract_text_from_txt_file(str(file_path)) == (
+        "café\nnaïve"
+    )
+
+
+def test_extract_text_from_empty_txt_file(tmp_path):
+    """
+    Test that an empty file yields an empty string, as empty files cannot be memory-mapped.
+
+    :param tmp_path: pytest's built-in fixture providing a temporary directory.
+    """
+    file_path = tmp_path / "empty.txt"
+    file_path.write_bytes(b"")
+
+    assert TextFileHelper().extract_text_from_txt_file(str(file_path)) == ""
+
+
+def test_extract_text_from_invalid_utf8_returns_empty_string():
+    """
+    Test that bytes which are not valid UTF-8 yield an empty string instead of raising.
+    """
+    assert TextFileHelper().extract_text_from_txt_bytes(b"\xff\xfe\xfa") == ""
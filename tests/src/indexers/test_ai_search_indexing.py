@@ -0,0 +1,199 @@
+import json
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+from langchain.docstore.document import Document
+from langchain_community.vectorstores.azuresearch import (
+    FIELDS_CONTENT,
+    FIELDS_CONTENT_VECTOR,
+    FIELDS_ID,
+    FIELDS_METADATA,
+)
+
+from src.indexers import ai_search_indexing
+from src.indexers.ai_search_indexing import AzureAIndexer, _document_key
+
+
+class FakeEmbeddings:
+    """
+    Offline stand-in for the embeddings object, recording the texts it embeds.
+    """
+
+    def __init__(self):
+        self.embedded_documents = []
+
+    def embed_query(self, text: str) -> List[float]:
+        return [float(len(text)), 1.0]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.embedded_documents.append(list(texts))
+        return [self.embed_query(text) for text in texts]
+
+
+class FakeSearchClient:
+    """
+    Offline stand-in for the SearchClient, recording the uploaded documents.
+    """
+
+    def __init__(self):
+        self.uploaded = []
+
+    def upload_documents(self, documents: List[dict]) -> List[SimpleNamespace]:
+        self.uploaded.append(documents)
+        return [
+            SimpleNamespace(key=document[FIELDS_ID], succeeded=True)
+            for document in documents
+        ]
+
+
+@pytest.fixture
+def indexer() -> AzureAIndexer:
+    """
+    Build an indexer without reading the environment or connecting to Azure.
+
+    :return: An AzureAIndexer with fake embeddings.
+    """
+    indexer = object.__new__(AzureAIndexer)
+    indexer.azure_ai_search_service_endpoint = "https://search.example.net"
+    indexer.azure_search_admin_key = "key"
+    indexer.index_name = "index"
+    indexer.embeddings = FakeEmbeddings()
+    return indexer
+
+
+def test_document_key_prefers_id_metadata():
+    """
+    Test that an explicit "id" in the metadata is used as the index key.
+    """
+    assert _document_key(Document(page_content="text", metadata={"id": "doc-1"})) == (
+        "doc-1"
+    )
+
+
+def test_document_key_is_derived_from_content():
+    """
+    Test that documents without an id get a stable key that depends only on their content.
+    """
+    first = _document_key(Document(page_content="same text", metadata={"page": 1}))
+    second = _document_key(Document(page_content="same text", metadata={"page": 2}))
+    other = _document_key(Document(page_content="other text"))
+
+    assert first == second
+    assert first != other
+
+
+def test_load_azureai_index_passes_callable_embedding_function(indexer, monkeypatch):
+    """
+    Test that AzureSearch receives a plain callable, which it calls with a single text.
+
+    :param indexer: Offline AzureAIndexer.
+    :param monkeypatch: pytest's built-in fixture for patching attributes.
+    """
+    captured = {}
+
+    def fake_azure_search(**kwargs):
+        captured.update(kwargs)
+        return SimpleNamespace(**kwargs)
+
+    monkeypatch.setattr(ai_search_indexing, "AzureSearch", fake_azure_search)
+
+    indexer.load_azureai_index()
+
+    embedding_function = captured["embedding_function"]
+    assert callable(embedding_function)
+    assert embedding_function("hello") == [5.0, 1.0]
+
+
+def _configured_indexer(index_name: str = "index") -> AzureAIndexer:
+    """
+    Build an offline indexer whose embeddings look as if load_embedding_model created them.
+
+    :param index_name: Name of the index.
+    :return: An AzureAIndexer with fake embeddings and a recorded embeddings configuration.
+    """
+    indexer = object.__new__(AzureAIndexer)
+    indexer.azure_ai_search_service_endpoint = "https://search.example.net"
+    indexer.azure_search_admin_key = "key"
+    indexer.index_name = index_name
+    indexer.embeddings = FakeEmbeddings()
+    indexer._embeddings_config = (
+        indexer.embeddings,
+        ("https://aoai.example.net", "embeddings", "2023-05-15"),
+    )
+    return indexer
+
+
+def test_load_azureai_index_shares_clients_across_indexers(monkeypatch):
+    """
+    Test that indexers with the same configuration share one AzureSearch client, even though
+    each has its own embeddings object, and that embeddings assigned directly are not cached.
+
+    :param monkeypatch: pytest's built-in fixture for patching attributes.
+    """
+    monkeypatch.setattr(
+        ai_search_indexing, "AzureSearch", lambda **kwargs: SimpleNamespace(**kwargs)
+    )
+    monkeypatch.setattr(AzureAIndexer, "_vector_store_cache", OrderedDict())
+
+    first = _configured_indexer().load_azureai_index()
+    second = _configured_indexer().load_azureai_index()
+    other_index = _configured_indexer("other").load_azureai_index()
+
+    assert second is first
+    assert other_index is not first
+
+    unconfigured = _configured_indexer()
+    unconfigured.embeddings = FakeEmbeddings()
+    assert unconfigured.load_azureai_index() is not first
+    assert len(AzureAIndexer._vector_store_cache) == 2
+
+
+def test_vector_store_cache_is_bounded(monkeypatch):
+    """
+    Test that the least recently used AzureSearch client is evicted once the cache is full.
+
+    :param monkeypatch: pytest's built-in fixture for patching attributes.
+    """
+    monkeypatch.setattr(
+        ai_search_indexing, "AzureSearch", lambda **kwargs: SimpleNamespace(**kwargs)
+    )
+    monkeypatch.setattr(AzureAIndexer, "_vector_store_cache", OrderedDict())
+    monkeypatch.setattr(ai_search_indexing, "_VECTOR_STORE_CACHE_SIZE", 2)
+
+    first = _configured_indexer("a").load_azureai_index()
+    _configured_indexer("b").load_azureai_index()
+    # Using "a" again makes "b" the least recently used entry
+    assert _configured_indexer("a").load_azureai_index() is first
+    _configured_indexer("c").load_azureai_index()
+
+    assert [key[2] for key in AzureAIndexer._vector_store_cache] == ["a", "c"]
+
+
+def test_add_documents_with_retry_embeds_once_and_uploads(indexer):
+    """
+    Test that a batch is deduplicated by key, embedded with one embed_documents call and
+    uploaded in the AzureSearch document layout.
+
+    :param indexer: Offline AzureAIndexer.
+    """
+    client = FakeSearchClient()
+    indexer.vector_store = SimpleNamespace(client=client)
+    batch = [
+        Document(page_content="alpha", metadata={"source": "a.pdf"}),
+        Document(page_content="beta", metadata={"source": "b.pdf"}),
+        Document(page_content="alpha", metadata={"source": "a.pdf"}),
+    ]
+
+    indexer._add_documents_with_retry(batch, max_retries=1)
+
+    assert indexer.embeddings.embedded_documents == [["alpha", "beta"]]
+    (uploaded,) = client.uploaded
+    assert [document[FIELDS_ID] for document in uploaded] == [
+        _document_key(batch[0]),
+        _document_key(batch[1]),
+    ]
+    assert uploaded[0][FIELDS_CONTENT] == "alpha"
+    assert uploaded[0][FIELDS_CONTENT_VECTOR] == [5.0, 1.0]
+    assert json.loads(uploaded[0][FIELDS_METADATA]) == {"source": "a.pdf"}